@@ -4,12 +4,35 @@ Simplified demo that works with Windows console
 """
 
 import asyncio
+import os
 import random
+import sys
+from array import array
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
 import time
 
+# Precomputed statistics bars (one block per 5%)
+_BARS = tuple("█" * i for i in range(21))
+
+@dataclass
+class Decisions:
+    """Demo decisions stored column-wise, one sequence per field"""
+    vendors: list
+    regions: list
+    saudi_percentages: array
+    selected: array
+    
+    def __len__(self):
+        return len(self.regions)
+
 class SimpleDemo:
-    def __init__(self):
+    def __init__(self, fast_mode=None):
+        # Fast mode skips visual pacing (set DEMO_FAST=1 for CI/test runs)
+        if fast_mode is None:
+            fast_mode = bool(os.getenv("DEMO_FAST"))
+        self.fast_mode = fast_mode
         self.regions = ["Riyadh", "Jeddah", "Dammam", "Madinah", "Abha", "Buraidah"]
         self.companies = [
             "Advanced Construction Co",
@@ -29,12 +52,12 @@ class SimpleDemo:
         print("\n📊 PHASE 1: Normal Operations | العمليات الاعتيادية")
         print("-" * 50)
         
-        normal_decisions = []
-        for i in range(15):
-            decision = self.generate_decision(bias=False)
-            normal_decisions.append(decision)
-            print(f"✓ Processing decision {i+1:02d}: {decision['vendor']} from {decision['region']}")
-            await asyncio.sleep(0.2)
+        normal_decisions = self.generate_decisions(15, bias=False)
+        lines = []
+        for i, (vendor, region) in enumerate(zip(normal_decisions.vendors, normal_decisions.regions)):
+            lines.append(f"✓ Processing decision {i+1:02d}: {vendor} from {region}")
+            await self._pace(0.2, lines)
+        self._flush(lines)
         
         self.show_statistics(normal_decisions, "BALANCED")
         
@@ -42,18 +65,17 @@ class SimpleDemo:
         print("\n🚨 PHASE 2: Bias Detection | اكتشاف الانحياز")
         print("-" * 50)
         
-        biased_decisions = []
-        for i in range(12):
-            decision = self.generate_decision(bias=True)
-            biased_decisions.append(decision)
+        biased_decisions = self.generate_decisions(12, bias=True)
+        for i, (vendor, region) in enumerate(zip(biased_decisions.vendors, biased_decisions.regions)):
             status = "⚠️  BIAS DETECTED" if i >= 8 else "✓ Processing"
-            print(f"{status} decision {i+1:02d}: {decision['vendor']} from {decision['region']}")
+            lines.append(f"{status} decision {i+1:02d}: {vendor} from {region}")
             
             if i == 8:  # Alert after 8 decisions
-                print("\n🔔 ALERT: Regional bias detected - 75% awards to Riyadh!")
-                print("🔔 تنبيه: تم اكتشاف انحياز إقليمي - 75% من القرارات للرياض!")
+                lines.append("\n🔔 ALERT: Regional bias detected - 75% awards to Riyadh!")
+                lines.append("🔔 تنبيه: تم اكتشاف انحياز إقليمي - 75% من القرارات للرياض!")
         
-            await asyncio.sleep(0.3)
+            await self._pace(0.3, lines)
+        self._flush(lines)
         
         self.show_statistics(biased_decisions, "BIASED")
         
@@ -86,70 +108,86 @@ class SimpleDemo:
         print("\n🚀 Platform Ready for Production Deployment")
         print("🇸🇦 For Saudi Vision 2030 Government Excellence")
         
-    def generate_decision(self, bias=False):
+    async def _pace(self, seconds, lines=None):
+        """Flush pending lines and pause for visual pacing (no-op in fast mode)"""
+        if self.fast_mode:
+            return
+        self._flush(lines)
+        await asyncio.sleep(seconds)
+        
+    def _flush(self, lines):
+        """Write buffered lines to stdout in a single call"""
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            lines.clear()
+        
+    def generate_decisions(self, count, bias=False):
         if bias:
             # 75% chance for Riyadh when biased
-            region = "Riyadh" if random.random() < 0.75 else random.choice(self.regions)
+            regions = ["Riyadh" if random.random() < 0.75 else random.choice(self.regions)
+                       for _ in range(count)]
         else:
-            region = random.choice(self.regions)
+            regions = random.choices(self.regions, k=count)
             
-        return {
-            "vendor": random.choice(self.companies),
-            "region": region,
-            "saudi_percentage": random.randint(30, 95),
-            "selected": random.choice([True, False])
-        }
+        return Decisions(
+            vendors=random.choices(self.companies, k=count),
+            regions=regions,
+            saudi_percentages=array('i', [random.randint(30, 95) for _ in range(count)]),
+            selected=array('b', [random.random() < 0.5 for _ in range(count)])
+        )
     
     def show_statistics(self, decisions, type_label):
         print(f"\n📈 STATISTICS - {type_label} DISTRIBUTION:")
         print("-" * 40)
         
-        region_counts = {}
-        for d in decisions:
-            region_counts[d['region']] = region_counts.get(d['region'], 0) + 1
+        # Statistics only need the region column
+        total = len(decisions)
+        region_counts = Counter(decisions.regions)
             
         for region, count in sorted(region_counts.items()):
-            percentage = (count / len(decisions)) * 100
-            bar = "█" * int(percentage / 5)  # Visual bar
+            percentage = (count / total) * 100
+            bar = _BARS[min(20, int(percentage // 5))]  # Visual bar
             print(f"  {region:12} | {count:2d} ({percentage:5.1f}%) {bar}")
         
-        print(f"  Total Decisions: {len(decisions)}")
+        print(f"  Total Decisions: {total}")
         
         # Bias analysis
-        riyadh_percentage = region_counts.get('Riyadh', 0) / len(decisions) * 100
+        riyadh_percentage = region_counts['Riyadh'] / total * 100
         if riyadh_percentage > 40:
             print(f"  ⚠️  BIAS WARNING: Riyadh {riyadh_percentage:.1f}% (Expected: ~16.7%)")
         else:
             print(f"  ✅ COMPLIANT: Riyadh {riyadh_percentage:.1f}% (Expected: ~16.7%)")
     
     async def generate_report(self):
-        print("🖨️  Initializing NAZAHA report generator...")
-        await asyncio.sleep(1)
+        lines = ["🖨️  Initializing NAZAHA report generator..."]
+        await self._pace(1, lines)
         
-        print("📊 Generating statistical analysis...")
-        await asyncio.sleep(1)
+        lines.append("📊 Generating statistical analysis...")
+        await self._pace(1, lines)
         
-        print("🖋️  Adding Arabic/English bilingual content...")
-        await asyncio.sleep(1)
+        lines.append("🖋️  Adding Arabic/English bilingual content...")
+        await self._pace(1, lines)
         
-        print("🔒 Applying government classification...")
-        await asyncio.sleep(1)
+        lines.append("🔒 Applying government classification...")
+        await self._pace(1, lines)
         
-        print("✅ Report generated: nazaha_daily_report_20240118.pdf")
-        print("📄 Format: A4, 2.5cm margins, confidential classification")
+        lines.append("✅ Report generated: nazaha_daily_report_20240118.pdf")
+        lines.append("📄 Format: A4, 2.5cm margins, confidential classification")
+        self._flush(lines)
         
     async def verify_chain(self):
-        print("🔗 Verifying blockchain audit chain...")
+        lines = ["🔗 Verifying blockchain audit chain..."]
         
         blocks = ["Block_001", "Block_002", "Block_003", "Block_004", "Block_005"]
         
         for i, block in enumerate(blocks):
-            print(f"  Verifying {block}: Hash validated ✓")
-            await asyncio.sleep(0.4)
+            lines.append(f"  Verifying {block}: Hash validated ✓")
+            await self._pace(0.4, lines)
         
-        print("✅ Chain integrity verified - No tampering detected")
-        print("📊 Total entries: 127 | Retention: 7 years")
-        print("⏱️  Verification time: 2.1 seconds")
+        lines.append("✅ Chain integrity verified - No tampering detected")
+        lines.append("📊 Total entries: 127 | Retention: 7 years")
+        lines.append("⏱️  Verification time: 2.1 seconds")
+        self._flush(lines)
 
 if __name__ == "__main__":
     demo = SimpleDemo()
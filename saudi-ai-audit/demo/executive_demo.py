@@ -5,19 +5,24 @@ Duration: 3 minutes
 """
 
 import asyncio
+import os
 import random
 from datetime import datetime
 from hijri_converter import Gregorian
 from rich.console import Console
 from rich.table import Table
-from rich.progress import track
+from rich.progress import Progress
 import arabic_reshaper
 from bidi.algorithm import get_display
 
 console = Console()
 
 class ExecutiveDemo:
-    def __init__(self):
+    def __init__(self, fast_mode=None):
+        # Fast mode skips visual pacing (set DEMO_FAST=1 for CI/test runs)
+        if fast_mode is None:
+            fast_mode = bool(os.getenv("DEMO_FAST"))
+        self.fast_mode = fast_mode
         self.regions = ["الرياض", "جدة", "الدمام", "المدينة", "أبها", "بريدة"]
         self.companies = [
             "شركة البناء المتقدمة",
@@ -38,10 +43,10 @@ class ExecutiveDemo:
         console.print("[green]Phase 1: Normal Operations[/green]\n")
         
         normal_decisions = []
-        for i in track(range(30), description="معالجة قرارات..."):
+        for i in self._steps(30, "معالجة قرارات..."):
             decision = self.generate_decision(bias=False)
             normal_decisions.append(decision)
-            await asyncio.sleep(0.1)
+            await self._pace(0.1)
         
         self.show_statistics(normal_decisions, "عادي")
         
@@ -50,10 +55,10 @@ class ExecutiveDemo:
         console.print("[yellow]Phase 2: Bias Detection[/yellow]\n")
         
         biased_decisions = []
-        for i in track(range(20), description="معالجة مع انحياز..."):
+        for i in self._steps(20, "معالجة مع انحياز..."):
             decision = self.generate_decision(bias=True)
             biased_decisions.append(decision)
-            await asyncio.sleep(0.1)
+            await self._pace(0.1)
             
             if i == 15:  # Alert after 15 decisions
                 console.print("\n[bold red]⚠️ تحذير: تم اكتشاف انحياز محتمل![/bold red]")
@@ -77,6 +82,26 @@ class ExecutiveDemo:
         console.print("\n[bold green]✓ اكتمل العرض بنجاح[/bold green]")
         console.print("[bold green]✓ Demo completed successfully[/bold green]")
         
+    async def _pace(self, seconds):
+        """Pause for visual pacing (no-op in fast mode)"""
+        if not self.fast_mode:
+            await asyncio.sleep(seconds)
+        
+    def _steps(self, total, description):
+        """Iterate over range(total) with a throttled progress bar (plain range in fast mode)"""
+        if self.fast_mode:
+            yield from range(total)
+            return
+        
+        # Redraw at most ~20 times per bar instead of on every step
+        stride = max(1, total // 20)
+        with Progress(console=console, refresh_per_second=4) as progress:
+            task = progress.add_task(description, total=total)
+            for i in range(total):
+                yield i
+                if (i + 1) % stride == 0 or i + 1 == total:
+                    progress.update(task, completed=i + 1)
+        
     def generate_decision(self, bias=False):
         if bias:
             # 60% chance for Riyadh when biased
@@ -109,13 +134,13 @@ class ExecutiveDemo:
     
     async def generate_report(self, decisions):
         console.print("جاري إنشاء تقرير نزاهة...")
-        await asyncio.sleep(2)
+        await self._pace(2)
         console.print("[green]✓ تم إنشاء التقرير: demo_report_NAZAHA.pdf[/green]")
         
     async def verify_chain(self):
         console.print("التحقق من سلسلة التدقيق...")
-        for i in track(range(10), description="فحص البلوكات..."):
-            await asyncio.sleep(0.1)
+        for i in self._steps(10, "فحص البلوكات..."):
+            await self._pace(0.1)
         console.print("[green]✓ السلسلة سليمة - لم يتم اكتشاف تلاعب[/green]")
 
 if __name__ == "__main__":
@@ -4,180 +4,239 @@ Executive demonstration for Ministry presentations
 """
 
 import asyncio
+import os
 import random
+import sys
+from array import array
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
 import time
 
+@dataclass
+class Decisions:
+    """Demo decisions stored column-wise, one sequence per field"""
+    vendors: list
+    regions: list
+    amounts: array
+    saudizations: array
+    
+    def __len__(self):
+        return len(self.regions)
+
+# Fixed row templates (%-formatting; %.20s truncates vendor names)
+_DECISION_FMT = "Processing decision %02d: %-20.20s | %-10s"
+_STATUS_FMT = "%-15s | Decision %02d: %-20.20s | %-10s"
+_REGION_ROW_FMT = "%-12s | %-5d | %7.1f%%   | %s"
+
+# Demo data (immutable, shared by all instances)
+_REGIONS = ("Riyadh", "Jeddah", "Dammam", "Madinah", "Abha", "Buraidah")
+_COMPANIES = (
+    "Advanced Construction Co",
+    "Modern Tech Foundation",
+    "Integrated Services Co",
+    "Saudi Business Group",
+    "National Contracting Co"
+)
+
+# Static run() output, built once at import time
+_BANNER = "\n".join([
+    "\n" + "=" * 65,
+    "          SAUDI AI AUDIT PLATFORM - EXECUTIVE DEMO",
+    "              Executive Demo for Ministry of Commerce",
+    "=" * 65
+]) + "\n"
+
+_FOOTER = "\n".join([
+    "\nKEY CAPABILITIES DEMONSTRATED:",
+    "  [1] Real-time bias detection (< 50ms response time)",
+    "  [2] NAZAHA anti-corruption compliance monitoring",
+    "  [3] Immutable blockchain audit trail (7-year retention)",
+    "  [4] Statistical analysis with chi-square significance testing",
+    "  [5] Government-ready bilingual reporting",
+    "  [6] Integration with Etimad and SAP systems",
+    "  [7] Complete Saudi validator system",
+    "  [8] Production deployment on RHEL 8",
+    
+    "\nGOVERNMENT COMPLIANCE FEATURES:",
+    "  - NAZAHA Anti-Corruption Authority compliance",
+    "  - Vision 2030 digital transformation alignment",
+    "  - Arabic/English bilingual support",
+    "  - 7-year audit data retention",
+    "  - SELinux security hardening",
+    "  - Air-gapped deployment capability",
+    
+    "\nTECHNICAL SPECIFICATIONS:",
+    "  - FastAPI with 4-worker production setup",
+    "  - Saudi-specific validation utilities",
+    "  - Statistical bias detection using scipy",
+    "  - Hijri calendar integration",
+    "  - Windows-1256 encoding for government systems",
+    
+    "\n[SUCCESS] Platform ready for Ministry deployment!",
+    "Contact: Saudi AI Audit Platform Team"
+]) + "\n"
+
+def _write(lines):
+    """Write a block of output lines to stdout in a single call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 class PlatformDemo:
-    def __init__(self):
-        self.regions = ["Riyadh", "Jeddah", "Dammam", "Madinah", "Abha", "Buraidah"]
-        self.companies = [
-            "Advanced Construction Co",
-            "Modern Tech Foundation", 
-            "Integrated Services Co",
-            "Saudi Business Group",
-            "National Contracting Co"
-        ]
+    def __init__(self, fast_mode=None):
+        # Fast mode skips visual pacing (--fast or DEMO_FAST=1 for CI/scaling runs)
+        if fast_mode is None:
+            fast_mode = bool(os.getenv("DEMO_FAST"))
+        self.fast_mode = fast_mode
+        self.regions = _REGIONS
+        self.companies = _COMPANIES
+        
+        # Biased draw: 70% direct Riyadh award, otherwise uniform over all regions
+        # (including Riyadh), folded into one weight vector aligned with self.regions
+        self._bias_weights = tuple(
+            (0.70 if region == "Riyadh" else 0.0) + 0.30 / len(_REGIONS)
+            for region in _REGIONS
+        )
+        
+        # Expected equal-distribution share and its alert thresholds
+        self._expected_pct = 100.0 / len(_REGIONS)
+        self._expected_high = self._expected_pct * 1.5  # 50% above expected
+        self._expected_low = self._expected_pct * 0.5   # 50% below expected
+        self._expected_2x = self._expected_pct * 2      # More than double expected
         
     async def run(self):
-        print("\n" + "=" * 65)
-        print("          SAUDI AI AUDIT PLATFORM - EXECUTIVE DEMO")
-        print("              Executive Demo for Ministry of Commerce")
-        print("=" * 65)
+        sys.stdout.write(_BANNER)
         
         start_time = time.time()
         
         # Phase 1: Normal Operations
-        print("\n[PHASE 1] Normal Operations - Balanced Distribution")
-        print("-" * 55)
+        lines = ["\n[PHASE 1] Normal Operations - Balanced Distribution", "-" * 55]
         
-        normal_decisions = []
-        for i in range(15):
-            decision = self.generate_decision(bias=False)
-            normal_decisions.append(decision)
-            print(f"Processing decision {i+1:02d}: {decision['vendor'][:20]:20} | {decision['region']:10}")
-            await asyncio.sleep(0.15)
+        # Decisions are independent - process them concurrently, report in order
+        normal_decisions = await self.process_decisions(self.generate_decisions(15, bias=False), delay=0.15)
+        for i, (vendor, region) in enumerate(zip(normal_decisions.vendors, normal_decisions.regions)):
+            lines.append(_DECISION_FMT % (i + 1, vendor, region))
         
-        print("\nANALYSIS RESULTS:")
+        lines.append("\nANALYSIS RESULTS:")
+        _write(lines)
         self.show_statistics(normal_decisions, "NORMAL")
         
         # Phase 2: Bias Detection
-        print("\n[PHASE 2] Bias Detection - Skewed Distribution")
-        print("-" * 55)
+        lines = ["\n[PHASE 2] Bias Detection - Skewed Distribution", "-" * 55]
         
-        biased_decisions = []
+        biased_decisions = await self.process_decisions(self.generate_decisions(12, bias=True), delay=0.2)
         alert_triggered = False
+        riyadh_count = 0
         
-        for i in range(12):
-            decision = self.generate_decision(bias=True)
-            biased_decisions.append(decision)
-            
-            # Calculate current bias
-            riyadh_count = sum(1 for d in biased_decisions if d['region'] == 'Riyadh')
-            riyadh_rate = riyadh_count / len(biased_decisions) * 100
-            
+        for i, (vendor, region) in enumerate(zip(biased_decisions.vendors, biased_decisions.regions)):
             status = "PROCESSING"
-            if riyadh_rate > 60 and not alert_triggered:
-                status = "*** BIAS ALERT ***"
-                alert_triggered = True
+            
+            # Running bias over the decisions seen so far - only needed until the alert fires
+            if not alert_triggered:
+                if region == 'Riyadh':
+                    riyadh_count += 1
+                if riyadh_count / (i + 1) * 100 > 60:
+                    status = "*** BIAS ALERT ***"
+                    alert_triggered = True
                 
-            print(f"{status:15} | Decision {i+1:02d}: {decision['vendor'][:20]:20} | {decision['region']:10}")
+            lines.append(_STATUS_FMT % (status, i + 1, vendor, region))
             
             if status == "*** BIAS ALERT ***":
-                print("                 WARNING: Regional bias detected!")
-                print("                 Riyadh receiving disproportionate awards")
-            
-            await asyncio.sleep(0.2)
+                lines.append("                 WARNING: Regional bias detected!")
+                lines.append("                 Riyadh receiving disproportionate awards")
         
-        print("\nBIAS ANALYSIS RESULTS:")
+        lines.append("\nBIAS ANALYSIS RESULTS:")
+        _write(lines)
         self.show_statistics(biased_decisions, "BIASED")
         
-        # Phase 3: Government Reporting
-        print("\n[PHASE 3] NAZAHA Report Generation")
-        print("-" * 55)
+        # Phase 3 (Government Reporting) and Phase 4 (Blockchain Integrity) share
+        # no data - run them concurrently, buffering each phase's output
+        report_log = ["\n[PHASE 3] NAZAHA Report Generation", "-" * 55]
+        chain_log = ["\n[PHASE 4] Blockchain Audit Trail Verification", "-" * 55]
         
-        await self.generate_nazaha_report()
-        
-        # Phase 4: Blockchain Integrity
-        print("\n[PHASE 4] Blockchain Audit Trail Verification")
-        print("-" * 55)
-        
-        await self.verify_blockchain()
+        await asyncio.gather(
+            self.generate_nazaha_report(log=report_log),
+            self.verify_blockchain(log=chain_log)
+        )
+        _write(report_log + chain_log)
         
         # Demo Summary
         total_time = time.time() - start_time
-        print("\n" + "=" * 65)
-        print("                    DEMO COMPLETED SUCCESSFULLY")
-        print(f"                    Total Duration: {total_time:.1f} seconds")
-        print("=" * 65)
-        
-        print("\nKEY CAPABILITIES DEMONSTRATED:")
-        print("  [1] Real-time bias detection (< 50ms response time)")
-        print("  [2] NAZAHA anti-corruption compliance monitoring")
-        print("  [3] Immutable blockchain audit trail (7-year retention)")
-        print("  [4] Statistical analysis with chi-square significance testing")
-        print("  [5] Government-ready bilingual reporting")
-        print("  [6] Integration with Etimad and SAP systems")
-        print("  [7] Complete Saudi validator system")
-        print("  [8] Production deployment on RHEL 8")
-        
-        print("\nGOVERNMENT COMPLIANCE FEATURES:")
-        print("  - NAZAHA Anti-Corruption Authority compliance")
-        print("  - Vision 2030 digital transformation alignment")
-        print("  - Arabic/English bilingual support")
-        print("  - 7-year audit data retention")
-        print("  - SELinux security hardening")
-        print("  - Air-gapped deployment capability")
-        
-        print("\nTECHNICAL SPECIFICATIONS:")
-        print("  - FastAPI with 4-worker production setup")
-        print("  - Saudi-specific validation utilities")
-        print("  - Statistical bias detection using scipy")
-        print("  - Hijri calendar integration")
-        print("  - Windows-1256 encoding for government systems")
-        
-        print(f"\n[SUCCESS] Platform ready for Ministry deployment!")
-        print("Contact: Saudi AI Audit Platform Team")
-        
-    def generate_decision(self, bias=False):
-        if bias:
-            # 70% chance for Riyadh when demonstrating bias
-            region = "Riyadh" if random.random() < 0.70 else random.choice(self.regions)
-        else:
-            region = random.choice(self.regions)
-            
-        return {
-            "vendor": random.choice(self.companies),
-            "region": region,
-            "amount": random.randint(100000, 800000),
-            "saudization": random.randint(30, 95)
-        }
+        _write([
+            "\n" + "=" * 65,
+            "                    DEMO COMPLETED SUCCESSFULLY",
+            f"                    Total Duration: {total_time:.1f} seconds",
+            "=" * 65
+        ])
+        sys.stdout.write(_FOOTER)
+        
+    async def process_decisions(self, decisions, delay=0.0):
+        """Simulate processing every decision in the batch concurrently"""
+        # Concurrent decisions of equal duration all finish after one delay,
+        # so a single timer stands in for one per decision
+        await self._pace(delay)
+        return decisions
+        
+    async def _pace(self, seconds):
+        """Pause for visual pacing (no-op in fast mode)"""
+        if not self.fast_mode:
+            await asyncio.sleep(seconds)
+        
+    def generate_decisions(self, count, bias=False):
+        """Generate a batch of decisions with one bulk draw per field"""
+        # 70% chance for Riyadh when demonstrating bias
+        weights = self._bias_weights if bias else None
+        
+        return Decisions(
+            vendors=random.choices(_COMPANIES, k=count),
+            regions=random.choices(_REGIONS, weights=weights, k=count),
+            amounts=array('l', random.choices(range(100000, 800001), k=count)),
+            saudizations=array('b', random.choices(range(30, 96), k=count))
+        )
     
     def show_statistics(self, decisions, analysis_type):
-        print(f"\nSTATISTICAL ANALYSIS - {analysis_type} SCENARIO:")
-        print("-" * 45)
-        
-        region_counts = {}
-        total_amount = 0
+        lines = [f"\nSTATISTICAL ANALYSIS - {analysis_type} SCENARIO:", "-" * 45]
         
-        for d in decisions:
-            region_counts[d['region']] = region_counts.get(d['region'], 0) + 1
-            total_amount += d['amount']
+        n = len(decisions)
+        region_counts = Counter(decisions.regions)
+        total_amount = sum(decisions.amounts)
             
-        print(f"{'Region':<12} | {'Count':<5} | {'Percentage':<10} | Status")
-        print("-" * 45)
+        lines.append(f"{'Region':<12} | {'Count':<5} | {'Percentage':<10} | Status")
+        lines.append("-" * 45)
         
-        for region, count in sorted(region_counts.items()):
-            percentage = (count / len(decisions)) * 100
-            expected = 100 / len(self.regions)  # Expected equal distribution
+        # Canonical region order; regions with no awards are listed as 0 (LOW)
+        for region in _REGIONS:
+            count = region_counts[region]
+            percentage = (count / n) * 100
             
-            if percentage > expected * 1.5:  # 50% above expected
+            if percentage > self._expected_high:
                 status = "HIGH"
-            elif percentage < expected * 0.5:  # 50% below expected  
+            elif percentage < self._expected_low:
                 status = "LOW"
             else:
                 status = "NORMAL"
                 
-            print(f"{region:<12} | {count:<5} | {percentage:>7.1f}%   | {status}")
+            lines.append(_REGION_ROW_FMT % (region, count, percentage, status))
         
-        print("-" * 45)
-        print(f"Total Decisions: {len(decisions)}")
-        print(f"Total Value: SAR {total_amount:,}")
-        print(f"Average Value: SAR {total_amount//len(decisions):,}")
+        lines.append("-" * 45)
+        lines.append(f"Total Decisions: {n}")
+        lines.append(f"Total Value: SAR {total_amount:,}")
+        lines.append(f"Average Value: SAR {total_amount//n:,}")
         
         # Bias assessment
-        riyadh_rate = region_counts.get('Riyadh', 0) / len(decisions) * 100
-        expected_rate = 100 / len(self.regions)
+        riyadh_rate = region_counts['Riyadh'] / n * 100
+        expected_rate = self._expected_pct
         
-        if riyadh_rate > expected_rate * 2:  # More than double expected
-            print(f"\nBIAS ASSESSMENT: DETECTED (Riyadh: {riyadh_rate:.1f}% vs Expected: {expected_rate:.1f}%)")
-            print("RECOMMENDATION: Manual review required")
-            print("NAZAHA STATUS: Non-compliant - Notification required")
+        if riyadh_rate > self._expected_2x:
+            lines.append(f"\nBIAS ASSESSMENT: DETECTED (Riyadh: {riyadh_rate:.1f}% vs Expected: {expected_rate:.1f}%)")
+            lines.append("RECOMMENDATION: Manual review required")
+            lines.append("NAZAHA STATUS: Non-compliant - Notification required")
         else:
-            print(f"\nBIAS ASSESSMENT: NORMAL (Riyadh: {riyadh_rate:.1f}% vs Expected: {expected_rate:.1f}%)")
-            print("NAZAHA STATUS: Compliant")
+            lines.append(f"\nBIAS ASSESSMENT: NORMAL (Riyadh: {riyadh_rate:.1f}% vs Expected: {expected_rate:.1f}%)")
+            lines.append("NAZAHA STATUS: Compliant")
+        
+        _write(lines)
     
-    async def generate_nazaha_report(self):
+    async def generate_nazaha_report(self, log=None):
         steps = [
             "Initializing report template...",
             "Collecting procurement decision data...", 
@@ -190,18 +249,24 @@ class PlatformDemo:
             "Finalizing PDF report..."
         ]
         
-        for step in steps:
-            print(f"  {step}")
-            await asyncio.sleep(0.3)
+        lines = [f"  {step}" for step in steps]
+        await self._pace(0.3 * len(steps))  # Single pacing pause for all steps
+        
+        lines.extend([
+            "\n  REPORT GENERATED SUCCESSFULLY:",
+            "  File: nazaha_daily_report_20241118.pdf",
+            "  Size: 2.4 MB",
+            "  Pages: 15 pages",
+            "  Classification: Confidential - Internal Government Use",
+            "  Retention: 7 years (Government requirement)"
+        ])
         
-        print("\n  REPORT GENERATED SUCCESSFULLY:")
-        print("  File: nazaha_daily_report_20241118.pdf")
-        print("  Size: 2.4 MB")
-        print("  Pages: 15 pages")
-        print("  Classification: Confidential - Internal Government Use")
-        print("  Retention: 7 years (Government requirement)")
+        if log is None:
+            _write(lines)
+        else:
+            log.extend(lines)
         
-    async def verify_blockchain(self):
+    async def verify_blockchain(self, log=None):
         blocks = [
             "Genesis Block (System Initialization)",
             "Block 001 (Procurement Decision Batch 1)",
@@ -211,23 +276,32 @@ class PlatformDemo:
             "Block 005 (Current Transaction Block)"
         ]
         
-        print("  Verifying audit chain integrity...")
-        
-        for i, block in enumerate(blocks):
-            hash_value = f"SHA256:{random.randint(100000, 999999):06d}"
-            print(f"  [{i+1}/6] {block}")
-            print(f"        Hash: {hash_value} - VERIFIED")
-            await asyncio.sleep(0.4)
-        
-        print("\n  BLOCKCHAIN VERIFICATION COMPLETE:")
-        print("  Chain Status: VALID (No tampering detected)")
-        print("  Total Blocks: 6")
-        print("  Total Transactions: 127")
-        print("  Verification Time: 2.4 seconds")
-        print("  Data Integrity: 100%")
-        print("  Retention Policy: 7 years (2024-2031)")
+        lines = ["  Verifying audit chain integrity..."]
+        
+        # Cosmetic placeholder hashes, drawn in one call
+        hashes = random.sample(range(100000, 1000000), len(blocks))
+        
+        for i, (block, hash_value) in enumerate(zip(blocks, hashes)):
+            lines.append(f"  [{i+1}/6] {block}")
+            lines.append(f"        Hash: SHA256:{hash_value:06d} - VERIFIED")
+        await self._pace(0.4 * len(blocks))  # Single pacing pause for all blocks
+        
+        lines.extend([
+            "\n  BLOCKCHAIN VERIFICATION COMPLETE:",
+            "  Chain Status: VALID (No tampering detected)",
+            "  Total Blocks: 6",
+            "  Total Transactions: 127",
+            "  Verification Time: 2.4 seconds",
+            "  Data Integrity: 100%",
+            "  Retention Policy: 7 years (2024-2031)"
+        ])
+        
+        if log is None:
+            _write(lines)
+        else:
+            log.extend(lines)
 
 if __name__ == "__main__":
     print("Starting Saudi AI Audit Platform Demo...")
-    demo = PlatformDemo()
+    demo = PlatformDemo(fast_mode=True if "--fast" in sys.argv[1:] else None)
     asyncio.run(demo.run())
\ No newline at end of file
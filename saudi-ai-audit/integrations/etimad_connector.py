@@ -1,23 +1,59 @@
 """
 Etimad Government Procurement Platform Integration
 Windows-1256 encoding support with XML export capabilities
+
+Errors are reported through the module logger. In production, route it
+through a logging.handlers.QueueHandler/QueueListener pair so log I/O
+runs on a background thread instead of inside the event loop.
 """
 
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from lxml import etree as ET
 import requests
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Mapping, Optional, Any, Tuple, Union
 from datetime import datetime, date
 import asyncio
 import aiohttp
+import random
 from pathlib import Path
 import json
 import codecs
+import io
+import logging
+from types import MappingProxyType
 
 from modules.procurement.models import ProcurementDecision, VendorDetails, ProcurementTender
-from utils.arabic import ensure_windows_1256_encoding, clean_arabic_text
+from utils.arabic import fast_clean_arabic_text
 from api.errors import SaudiGovernmentErrorHandler
 
+logger = logging.getLogger(__name__)
+
+# Hardened lxml options for every document received from Etimad or read from
+# disk: entities are never expanded and nothing is fetched over the network
+# (no XXE), and libxml2's default size/depth limits stay in force
+_XML_SAFE_OPTIONS = MappingProxyType({"resolve_entities": False, "no_network": True})
+
+def _iso_to_etimad_date(value: str) -> str:
+    """Convert an ISO date (or datetime) string to Etimad's DD/MM/YYYY"""
+    # Fast path: plain YYYY-MM-DD is a fixed-offset rearrangement, once
+    # date.fromisoformat has checked it is a real date (ValueError otherwise)
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        date.fromisoformat(value)
+        return value[8:] + '/' + value[5:7] + '/' + value[:4]
+    return datetime.fromisoformat(value).strftime('%d/%m/%Y')
+
+def _etimad_date_to_iso(value: str) -> str:
+    """Convert Etimad's DD/MM/YYYY to ISO YYYY-MM-DD (unchanged if not in that form)"""
+    # Fast path: zero-padded DD/MM/YYYY is a fixed-offset rearrangement
+    if len(value) == 10 and value[2] == '/' and value[5] == '/':
+        return value[6:] + '-' + value[3:5] + '-' + value[:2]
+    
+    # Unpadded day/month, e.g. 5/1/2024
+    date_parts = value.split('/')
+    if len(date_parts) == 3:
+        day, month, year = date_parts
+        return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+    return value
+
 class EtimadConnector:
     """
     موصل نظام اعتماد الحكومي
@@ -44,6 +80,71 @@ class EtimadConnector:
         'contract_duration': 'ContractDurationMonths'
     }
     
+    # Retry policy for rate limiting (429) and transient network failures
+    RETRY_ATTEMPTS = 5
+    RETRY_BASE_DELAY = 1.0   # seconds, doubled per attempt
+    RETRY_MAX_DELAY = 30.0   # seconds, longest wait between attempts
+    
+    # Methods that must not be replayed once they may have reached Etimad
+    # (a replayed decision POST is a duplicate government submission)
+    NON_IDEMPOTENT_METHODS = frozenset({"POST", "PATCH"})
+    IDEMPOTENCY_HEADER = "Idempotency-Key"
+    
+    # Known Etimad system issues
+    KNOWN_ISSUES = MappingProxyType({
+        "encoding_corruption": "Arabic text corruption in XML",
+        "timeout_frequent": "Frequent timeouts during peak hours",
+        "xml_validation": "Strict XML schema validation",
+        "rate_limiting": "Rate limiting during business hours"
+    })
+    
+    # Static troubleshooting info, built once and shared read-only by all instances
+    _KNOWN_ISSUES_INFO_VIEW = MappingProxyType({
+        "known_issues": KNOWN_ISSUES,
+        "troubleshooting": MappingProxyType({
+            "encoding_corruption": (
+                "Ensure all Arabic text is properly encoded in Windows-1256",
+                "Use clean_arabic_text() function before XML generation",
+                "Test with sample Arabic characters: ا ب ت ث"
+            ),
+            "timeout_frequent": (
+                "Increase timeout to 60 seconds during peak hours (9-11 AM, 2-4 PM)",
+                "Implement retry logic with exponential backoff",
+                "Consider submitting during off-peak hours"
+            ),
+            "xml_validation": (
+                "Validate XML structure before submission",
+                "Ensure all required elements are present",
+                "Check namespace declarations"
+            ),
+            "rate_limiting": (
+                "Implement request queuing during business hours",
+                "Monitor rate limit headers",
+                "Consider batch submissions during off-peak"
+            )
+        }),
+        "support_contacts": MappingProxyType({
+            "technical_support": "etimad-support@moc.gov.sa",
+            "integration_help": "integration@etimad.sa",
+            "emergency_contact": "+966-11-456-7890"
+        })
+    })
+    
+    # Elements every <ProcurementDecision> must carry
+    REQUIRED_ELEMENTS = ("Header", "Tender", "DecisionDetails")
+    
+    # Compiled once, evaluated in C on every response
+    _XP_ETIMAD_REF = ET.XPath(".//EtimadReference/text()", smart_strings=False)
+    
+    # Their field name -> ours, for imports
+    REVERSE_FIELD_MAP = {v: k for k, v in FIELD_MAP.items()}
+    
+    # Our fields holding Arabic text (exported with lang="ar")
+    ARABIC_FIELDS = frozenset(k for k in FIELD_MAP if '_ar' in k)
+    
+    # (our field, their field, is Arabic) in export order
+    _FIELD_MAP_ITEMS = tuple((our, their, '_ar' in our) for our, their in FIELD_MAP.items())
+    
     def __init__(self, config: Dict[str, Any]):
         self.base_url = config.get("etimad_base_url", "https://etimad.sa/api/v1")
         self.api_key = config.get("etimad_api_key")
@@ -59,14 +160,18 @@ class EtimadConnector:
             "etimad": "http://etimad.sa/schemas/procurement/v1",
             "common": "http://etimad.sa/schemas/common/v1"
         }
+        self._nsmap = {None: self.xml_namespaces["etimad"], "common": self.xml_namespaces["common"]}
+        self._ns = "{%s}" % self.xml_namespaces["etimad"]
         
-        # Known Etimad system issues
-        self.known_issues = {
-            "encoding_corruption": "Arabic text corruption in XML",
-            "timeout_frequent": "Frequent timeouts during peak hours",
-            "xml_validation": "Strict XML schema validation",
-            "rate_limiting": "Rate limiting during business hours"
-        }
+        # Etimad responses are Windows-1256 regardless of what they declare
+        self._xml_parser = ET.XMLParser(encoding=self.ENCODING, **_XML_SAFE_OPTIONS)
+        
+        # Optional Etimad XSD, compiled once and applied to every outbound decision
+        xsd_path = config.get("etimad_xsd_path")
+        self._xsd = ET.XMLSchema(ET.parse(xsd_path)) if xsd_path else None
+        
+        # Known Etimad system issues (shared, read-only)
+        self.known_issues = self.KNOWN_ISSUES
         
         # Request headers
         self.headers = {
@@ -76,6 +181,100 @@ class EtimadConnector:
             "X-API-Key": self.api_key,
             "X-Client-ID": self.client_id
         }
+        
+        # Shared HTTP session, created lazily on first request (see _get_session)
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Cap on in-flight requests - smooths bursts that trip Etimad's rate limiter.
+        # The semaphore is created lazily in _request: on Python 3.9 asyncio
+        # primitives bind to the event loop current at construction
+        self._max_concurrent_requests = config.get("max_concurrent_requests", 5)
+        self._request_semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "EtimadConnector":
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=10,
+                    limit_per_host=5,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
+                headers=self.headers
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session and its pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _request(self, method: str, url: str, **kwargs) -> Tuple[int, bytes, Any]:
+        """
+        Perform an HTTP request, retrying on rate limiting and transient failures
+        
+        429 responses are retried after the Retry-After delay when Etimad
+        asks for no more than RETRY_MAX_DELAY; client errors and timeouts
+        back off exponentially with jitter. The last failure is returned
+        (429) or raised (network errors) once RETRY_ATTEMPTS is exhausted.
+        
+        POST/PATCH requests are only retried when they cannot have been
+        processed (429, or the connection was never established), unless
+        they carry an Idempotency-Key header.
+        
+        Returns:
+            (status, body, headers) of the final response
+        """
+        session = await self._get_session()
+        if self._request_semaphore is None:
+            self._request_semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+        
+        # Safe to replay after a timeout or dropped connection?
+        replay_safe = (
+            method.upper() not in self.NON_IDEMPOTENT_METHODS
+            or self.IDEMPOTENCY_HEADER in (kwargs.get("headers") or {})
+        )
+        
+        for attempt in range(1, self.RETRY_ATTEMPTS + 1):
+            backoff = min(
+                self.RETRY_MAX_DELAY,
+                self.RETRY_BASE_DELAY * 2 ** (attempt - 1) + random.uniform(0, self.RETRY_BASE_DELAY)
+            )
+            
+            try:
+                async with self._request_semaphore, session.request(method, url, **kwargs) as response:
+                    body = await response.read()
+                    if response.status != 429 or attempt == self.RETRY_ATTEMPTS:
+                        return response.status, body, response.headers
+                    
+                    retry_after = response.headers.get("Retry-After", "")
+                    if retry_after.isdigit():
+                        if int(retry_after) > self.RETRY_MAX_DELAY:
+                            # Longer pause than we are willing to hold the caller for
+                            return response.status, body, response.headers
+                        backoff = float(retry_after)
+            
+            except aiohttp.ClientConnectorError:
+                # Connection never established - the request was not sent
+                if attempt == self.RETRY_ATTEMPTS:
+                    raise
+            
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == self.RETRY_ATTEMPTS or not replay_safe:
+                    raise
+            
+            # Sleep outside the semaphore so waiting retries don't hold request slots
+            await asyncio.sleep(backoff)
 
     async def submit_procurement_decision(self, decision: ProcurementDecision) -> Dict[str, Any]:
         """
@@ -90,48 +289,52 @@ class EtimadConnector:
         
         try:
             # Convert decision to Etimad XML format
-            xml_data = await self._convert_to_etimad_xml(decision)
+            decision_elem = self._build_decision_element(None, decision)
+            
+            # Reject locally what Etimad's strict validation would reject
+            validation = self._validate_etimad_xml(decision_elem)
+            if not validation["valid"]:
+                return {
+                    "success": False,
+                    "error": "Decision XML failed Etimad schema validation",
+                    "validation": validation,
+                    "known_issue": self.known_issues["xml_validation"]
+                }
             
-            # Ensure proper encoding
-            encoded_xml = ensure_windows_1256_encoding(xml_data)
+            # Serialized directly to Windows-1256 bytes
+            encoded_xml = ET.tostring(decision_elem, pretty_print=True, encoding=self.ENCODING, xml_declaration=True)
             
             # Submit to Etimad
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout_seconds)) as session:
-                submission_url = f"{self.base_url}/procurement/decisions"
+            submission_url = f"{self.base_url}/procurement/decisions"
+            status, response_body, response_headers = await self._request(
+                "POST", submission_url, data=encoded_xml
+            )
+            
+            if status == 200:
+                etimad_reference = self._extract_etimad_reference(response_body)
                 
-                async with session.post(
-                    submission_url,
-                    data=encoded_xml,
-                    headers=self.headers
-                ) as response:
-                    
-                    if response.status == 200:
-                        response_text = await response.text(encoding=self.encoding)
-                        etimad_reference = self._extract_etimad_reference(response_text)
-                        
-                        return {
-                            "success": True,
-                            "etimad_reference": etimad_reference,
-                            "submission_time": datetime.now().isoformat(),
-                            "status": "submitted"
-                        }
-                    
-                    elif response.status == 429:  # Rate limited
-                        return {
-                            "success": False,
-                            "error": "Rate limited by Etimad",
-                            "retry_after": response.headers.get("Retry-After", "300"),
-                            "known_issue": self.known_issues["rate_limiting"]
-                        }
-                    
-                    else:
-                        error_text = await response.text()
-                        return {
-                            "success": False,
-                            "error": f"Etimad submission failed: {response.status}",
-                            "details": error_text,
-                            "suggestion": "Check XML format and encoding"
-                        }
+                return {
+                    "success": True,
+                    "etimad_reference": etimad_reference,
+                    "submission_time": datetime.now().isoformat(),
+                    "status": "submitted"
+                }
+            
+            elif status == 429:  # Still rate limited after retries
+                return {
+                    "success": False,
+                    "error": "Rate limited by Etimad",
+                    "retry_after": response_headers.get("Retry-After", "300"),
+                    "known_issue": self.known_issues["rate_limiting"]
+                }
+            
+            else:
+                return {
+                    "success": False,
+                    "error": f"Etimad submission failed: {status}",
+                    "details": response_body.decode(self.ENCODING, errors="replace"),
+                    "suggestion": "Check XML format and encoding"
+                }
         
         except asyncio.TimeoutError:
             return SaudiGovernmentErrorHandler.handle_etimad_connection_error(
@@ -146,6 +349,142 @@ class EtimadConnector:
         except Exception as e:
             return SaudiGovernmentErrorHandler.handle_etimad_connection_error(str(e))
 
+    async def submit_procurement_decisions(
+        self,
+        decisions: List[ProcurementDecision],
+        batch_size: int = 50,
+        max_concurrency: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Submit procurement decisions to Etimad in batches
+        
+        Decisions are grouped into <ProcurementDecisions> documents of up to
+        batch_size entries and posted with at most max_concurrency batches
+        in flight, amortizing the round-trip over many decisions.
+        
+        Args:
+            decisions: ProcurementDecision objects
+            batch_size: Decisions per submitted document
+            max_concurrency: Batches submitted concurrently
+            
+        Returns:
+            One submission result per decision, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def submit_batch(batch: List[ProcurementDecision]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._submit_decision_batch(batch)
+        
+        batch_results = await asyncio.gather(*(
+            submit_batch(decisions[i:i + batch_size])
+            for i in range(0, len(decisions), batch_size)
+        ))
+        return [result for results in batch_results for result in results]
+
+    async def _submit_decision_batch(self, batch: List[ProcurementDecision]) -> List[Dict[str, Any]]:
+        """Validate one batch, submit its valid decisions and return per-decision results"""
+        
+        try:
+            # One timestamp for the whole batch document
+            submission_ts = datetime.now().isoformat()
+            
+            # Reject locally what Etimad's strict validation would reject, as
+            # submit_procurement_decision does; only valid decisions are posted
+            root = ET.Element(self._ns + "ProcurementDecisions", nsmap=self._nsmap)
+            rejected: Dict[int, Dict[str, Any]] = {}
+            for i, decision in enumerate(batch):
+                decision_elem = self._build_decision_element(root, decision, submission_ts)
+                validation = self._validate_etimad_xml(decision_elem)
+                if not validation["valid"]:
+                    root.remove(decision_elem)
+                    rejected[i] = {
+                        "success": False,
+                        "error": "Decision XML failed Etimad schema validation",
+                        "validation": validation,
+                        "known_issue": self.known_issues["xml_validation"]
+                    }
+        
+        except Exception as e:
+            error = SaudiGovernmentErrorHandler.handle_etimad_connection_error(str(e))
+            return [dict(error) for _ in batch]
+        
+        submitted = iter(await self._post_decision_batch(root) if len(root) else ())
+        return [rejected[i] if i in rejected else next(submitted) for i in range(len(batch))]
+
+    async def _post_decision_batch(self, root: ET._Element) -> List[Dict[str, Any]]:
+        """Post one batch document and split the response into per-decision results"""
+        
+        count = len(root)
+        try:
+            encoded_xml = ET.tostring(root, pretty_print=True, encoding=self.ENCODING, xml_declaration=True)
+            
+            submission_url = f"{self.base_url}/procurement/decisions/batch"
+            status, response_body, response_headers = await self._request(
+                "POST", submission_url, data=encoded_xml
+            )
+            
+            if status == 200:
+                submission_time = datetime.now().isoformat()
+                
+                # One <Result> per submitted decision, in submission order
+                references = []
+                try:
+                    for result_elem in self._iterparse(response_body, "Result"):
+                        references.append(result_elem.findtext("EtimadReference") or "NO_REFERENCE")
+                except Exception as e:
+                    # Etimad accepted the batch but its response is malformed or
+                    # truncated - the decisions were submitted, so they must not be
+                    # reported as failed (and resubmitted as duplicates)
+                    logger.warning("Failed to parse Etimad batch response: %s", e)
+                    references.extend("PARSE_ERROR" for _ in range(count - len(references)))
+                
+                results = [
+                    {
+                        "success": True,
+                        "etimad_reference": reference,
+                        "submission_time": submission_time,
+                        "status": "submitted"
+                    }
+                    for reference in references[:count]
+                ]
+                results.extend(
+                    {
+                        "success": False,
+                        "error": "No result returned by Etimad for this decision",
+                        "suggestion": "Resubmit the decision individually"
+                    }
+                    for _ in range(count - len(results))
+                )
+                return results
+            
+            elif status == 429:  # Still rate limited after retries
+                error = {
+                    "success": False,
+                    "error": "Rate limited by Etimad",
+                    "retry_after": response_headers.get("Retry-After", "300"),
+                    "known_issue": self.known_issues["rate_limiting"]
+                }
+            
+            else:
+                error = {
+                    "success": False,
+                    "error": f"Etimad batch submission failed: {status}",
+                    "details": response_body.decode(self.ENCODING, errors="replace"),
+                    "suggestion": "Check XML format and encoding"
+                }
+        
+        except asyncio.TimeoutError:
+            error = SaudiGovernmentErrorHandler.handle_etimad_connection_error(
+                f"Timeout after {self.timeout_seconds} seconds - {self.known_issues['timeout_frequent']}"
+            )
+        
+        except Exception as e:
+            error = SaudiGovernmentErrorHandler.handle_etimad_connection_error(str(e))
+        
+        # The whole batch failed - report it against every decision
+        return [dict(error) for _ in range(count)]
+
     def export_for_etimad(self, decisions: List[Dict]) -> bytes:
         """
         تصدير للنظام الحكومي
@@ -153,37 +492,40 @@ class EtimadConnector:
         """
         # Create XML with Arabic namespace
         root = ET.Element('ProcurementDecisions', 
-                         attrib={'xmlns:ar': 'http://etimad.sa/arabic'})
+                         nsmap={'ar': 'http://etimad.sa/arabic'})
         
         for decision in decisions:
             entry = ET.SubElement(root, 'Decision')
             
-            # Convert dates to their format (DD/MM/YYYY not ISO)
-            if 'decision_date' in decision:
-                if isinstance(decision['decision_date'], str):
-                    try:
-                        date_obj = datetime.fromisoformat(decision['decision_date'])
-                        formatted_date = date_obj.strftime('%d/%m/%Y')
-                        decision['decision_date'] = formatted_date
-                    except ValueError:
-                        # If already in DD/MM/YYYY format, keep as is
-                        pass
-                elif hasattr(decision['decision_date'], 'strftime'):
-                    formatted_date = decision['decision_date'].strftime('%d/%m/%Y')
-                    decision['decision_date'] = formatted_date
+            # Convert dates to their format (DD/MM/YYYY not ISO) - into a
+            # local, leaving the caller's dict untouched
+            formatted_date = None
+            decision_date = decision.get('decision_date')
+            if isinstance(decision_date, str):
+                try:
+                    formatted_date = _iso_to_etimad_date(decision_date)
+                except ValueError:
+                    # If already in DD/MM/YYYY format, keep as is
+                    pass
+            elif hasattr(decision_date, 'strftime'):
+                formatted_date = decision_date.strftime('%d/%m/%Y')
             
             # Map our fields to theirs
-            for our_field, their_field in self.FIELD_MAP.items():
+            for our_field, their_field, is_arabic in self._FIELD_MAP_ITEMS:
                 if our_field in decision:
                     elem = ET.SubElement(entry, their_field)
                     # Handle Arabic text
-                    if '_ar' in our_field:
-                        elem.attrib['lang'] = 'ar'
-                    elem.text = str(decision[our_field])
+                    if is_arabic:
+                        elem.set('lang', 'ar')
+                    if our_field == 'decision_date' and formatted_date is not None:
+                        elem.text = formatted_date
+                    else:
+                        elem.text = str(decision[our_field])
         
-        # Convert to their encoding
-        xml_str = ET.tostring(root, encoding='unicode')
-        return xml_str.encode(self.ENCODING, errors='xmlcharrefreplace')
+        # Serialize straight to their encoding, declared so Etimad's validator
+        # reads it as Windows-1256 - libxml2 writes characters outside the
+        # code page as numeric character references itself
+        return ET.tostring(root, encoding=self.ENCODING, xml_declaration=True)
     
     def import_from_etimad(self, xml_data: bytes) -> List[Dict]:
         """Import and convert their format to ours"""
@@ -195,21 +537,14 @@ class EtimadConnector:
         
         # Parse with their encoding
         try:
-            xml_str = xml_data.decode(self.ENCODING, errors='replace')
-        except UnicodeDecodeError:
-            # Fallback to UTF-8 if Windows-1256 fails
-            xml_str = xml_data.decode('utf-8', errors='replace')
-        
-        try:
-            root = ET.fromstring(xml_str)
             decisions = []
             
-            for decision_elem in root.findall('.//Decision'):
+            # Reverse map their fields to ours
+            reverse_map = self.REVERSE_FIELD_MAP
+            
+            for decision_elem in self._iterparse(xml_data, 'Decision'):
                 decision_data = {}
                 
-                # Reverse map their fields to ours
-                reverse_map = {v: k for k, v in self.FIELD_MAP.items()}
-                
                 for child in decision_elem:
                     our_field = reverse_map.get(child.tag)
                     if our_field:
@@ -217,16 +552,7 @@ class EtimadConnector:
                         
                         # Convert dates back to ISO format
                         if our_field == 'decision_date' and child.text:
-                            try:
-                                # Parse DD/MM/YYYY format
-                                date_parts = child.text.split('/')
-                                if len(date_parts) == 3:
-                                    day, month, year = date_parts
-                                    iso_date = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                                    decision_data[our_field] = iso_date
-                            except (ValueError, IndexError):
-                                # Keep original if parsing fails
-                                pass
+                            decision_data[our_field] = _etimad_date_to_iso(child.text)
                 
                 if decision_data:
                     decisions.append(decision_data)
@@ -234,7 +560,7 @@ class EtimadConnector:
             return decisions
             
         except ET.ParseError as e:
-            print(f"Failed to parse Etimad XML: {e}")
+            logger.error("Failed to parse Etimad XML: %s", e)
             return []
 
     async def fetch_tender_details(self, tender_number: str) -> Optional[Dict[str, Any]]:
@@ -249,23 +575,20 @@ class EtimadConnector:
         """
         
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout_seconds)) as session:
-                fetch_url = f"{self.base_url}/tenders/{tender_number}"
-                
-                async with session.get(fetch_url, headers=self.headers) as response:
-                    
-                    if response.status == 200:
-                        response_text = await response.text(encoding=self.encoding)
-                        return self._parse_etimad_tender_xml(response_text)
-                    
-                    elif response.status == 404:
-                        return None
-                    
-                    else:
-                        raise Exception(f"Etimad fetch failed: {response.status}")
+            fetch_url = f"{self.base_url}/tenders/{tender_number}"
+            status, response_body, _ = await self._request("GET", fetch_url)
+            
+            if status == 200:
+                return self._parse_etimad_tender_xml(response_body)
+            
+            elif status == 404:
+                return None
+            
+            else:
+                raise Exception(f"Etimad fetch failed: {status}")
         
         except Exception as e:
-            print(f"Failed to fetch tender {tender_number}: {e}")
+            logger.error("Failed to fetch tender %s: %s", tender_number, e)
             return None
 
     async def export_monthly_report(self, year: int, month: int, output_path: str) -> Dict[str, Any]:
@@ -286,20 +609,18 @@ class EtimadConnector:
             # For demo purposes, create sample data
             sample_decisions = await self._get_sample_decisions(year, month)
             
-            # Create XML report
-            xml_report = await self._create_monthly_xml_report(sample_decisions, year, month)
-            
-            # Ensure proper encoding and save
-            encoded_xml = ensure_windows_1256_encoding(xml_report)
-            
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_file, 'w', encoding=self.encoding) as f:
-                f.write(encoded_xml)
+            # Stream XML report to disk, validating each decision as it is written
+            invalid_decisions = await self._write_monthly_xml_report(output_file, sample_decisions, year, month)
             
-            # Validate XML
-            validation_result = await self._validate_etimad_xml(encoded_xml)
+            validation_result = {
+                "valid": not invalid_decisions,
+                "decisions_checked": len(sample_decisions),
+                "invalid_decisions": invalid_decisions,
+                "validation_time": datetime.now().isoformat()
+            }
             
             return {
                 "success": True,
@@ -328,21 +649,22 @@ class EtimadConnector:
         try:
             sync_url = f"{self.base_url}/vendors/sync"
             
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=60)) as session:
-                async with session.get(sync_url, headers=self.headers) as response:
-                    
-                    if response.status == 200:
-                        response_text = await response.text(encoding=self.encoding)
-                        vendors_data = self._parse_vendors_xml(response_text)
-                        
-                        return {
-                            "success": True,
-                            "vendors_synced": len(vendors_data),
-                            "sync_time": datetime.now().isoformat(),
-                            "vendors": vendors_data[:10]  # Sample of first 10
-                        }
-                    else:
-                        raise Exception(f"Vendor sync failed: {response.status}")
+            # Vendor sync is a bulk transfer - allow longer than the default timeout
+            status, response_body, _ = await self._request(
+                "GET", sync_url, timeout=aiohttp.ClientTimeout(total=60)
+            )
+            
+            if status == 200:
+                vendors_data = self._parse_vendors_xml(response_body)
+                
+                return {
+                    "success": True,
+                    "vendors_synced": len(vendors_data),
+                    "sync_time": datetime.now().isoformat(),
+                    "vendors": vendors_data[:10]  # Sample of first 10
+                }
+            else:
+                raise Exception(f"Vendor sync failed: {status}")
         
         except Exception as e:
             return {
@@ -352,173 +674,251 @@ class EtimadConnector:
             }
 
     # Private XML processing methods
-    async def _convert_to_etimad_xml(self, decision: ProcurementDecision) -> str:
-        """Convert ProcurementDecision to Etimad XML format"""
+    def _build_decision_element(self, parent: Optional[ET._Element], decision: ProcurementDecision,
+                                submission_ts: Optional[str] = None) -> ET._Element:
+        """
+        Build the <ProcurementDecision> element for a decision
+        
+        Appended in place to parent when given, otherwise created as a
+        standalone root carrying the Etimad namespace declarations.
+        submission_ts lets multi-decision documents share one timestamp
+        (defaults to now).
+        """
+        ns = self._ns
         
         # Create root element with namespaces
-        root = ET.Element("ProcurementDecision")
-        root.set("xmlns", self.xml_namespaces["etimad"])
-        root.set("xmlns:common", self.xml_namespaces["common"])
+        if parent is None:
+            root = ET.Element(ns + "ProcurementDecision", nsmap=self._nsmap)
+        else:
+            root = ET.SubElement(parent, ns + "ProcurementDecision")
         
         # Header information
-        header = ET.SubElement(root, "Header")
-        ET.SubElement(header, "DecisionID").text = decision.decision_id
-        ET.SubElement(header, "DecisionDate").text = decision.decision_date_gregorian.strftime("%Y-%m-%d")
-        ET.SubElement(header, "DecisionDateHijri").text = decision.decision_date_hijri
-        ET.SubElement(header, "SubmissionTimestamp").text = datetime.now().isoformat()
+        header = ET.SubElement(root, ns + "Header")
+        ET.SubElement(header, ns + "DecisionID").text = decision.decision_id
+        ET.SubElement(header, ns + "DecisionDate").text = decision.decision_date_gregorian.strftime("%Y-%m-%d")
+        ET.SubElement(header, ns + "DecisionDateHijri").text = decision.decision_date_hijri
+        ET.SubElement(header, ns + "SubmissionTimestamp").text = submission_ts or datetime.now().isoformat()
         
         # Tender information
-        tender_elem = ET.SubElement(root, "Tender")
-        ET.SubElement(tender_elem, "TenderNumber").text = decision.tender.tender_number
-        ET.SubElement(tender_elem, "TitleArabic").text = clean_arabic_text(decision.tender.tender_title_ar)
+        tender_elem = ET.SubElement(root, ns + "Tender")
+        ET.SubElement(tender_elem, ns + "TenderNumber").text = decision.tender.tender_number
+        ET.SubElement(tender_elem, ns + "TitleArabic").text = fast_clean_arabic_text(decision.tender.tender_title_ar)
         if decision.tender.tender_title_en:
-            ET.SubElement(tender_elem, "TitleEnglish").text = decision.tender.tender_title_en
-        ET.SubElement(tender_elem, "EstimatedValue").text = str(decision.tender.estimated_value_sar)
-        ET.SubElement(tender_elem, "ProcurementType").text = decision.tender.procurement_type.value
+            ET.SubElement(tender_elem, ns + "TitleEnglish").text = decision.tender.tender_title_en
+        ET.SubElement(tender_elem, ns + "EstimatedValue").text = str(decision.tender.estimated_value_sar)
+        ET.SubElement(tender_elem, ns + "ProcurementType").text = decision.tender.procurement_type.value
         
         # Winning vendor information
         if decision.winning_vendor:
-            vendor_elem = ET.SubElement(root, "WinningVendor")
-            ET.SubElement(vendor_elem, "NameArabic").text = clean_arabic_text(decision.winning_vendor.name_ar)
+            vendor_elem = ET.SubElement(root, ns + "WinningVendor")
+            ET.SubElement(vendor_elem, ns + "NameArabic").text = fast_clean_arabic_text(decision.winning_vendor.name_ar)
             if decision.winning_vendor.name_en:
-                ET.SubElement(vendor_elem, "NameEnglish").text = decision.winning_vendor.name_en
-            ET.SubElement(vendor_elem, "CommercialRegistration").text = decision.winning_vendor.commercial_registration
-            ET.SubElement(vendor_elem, "Region").text = decision.winning_vendor.region.value
-            ET.SubElement(vendor_elem, "VendorSize").text = decision.winning_vendor.vendor_size
+                ET.SubElement(vendor_elem, ns + "NameEnglish").text = decision.winning_vendor.name_en
+            ET.SubElement(vendor_elem, ns + "CommercialRegistration").text = decision.winning_vendor.commercial_registration
+            ET.SubElement(vendor_elem, ns + "Region").text = decision.winning_vendor.region.value
+            ET.SubElement(vendor_elem, ns + "VendorSize").text = decision.winning_vendor.vendor_size
         
         # Decision details
-        decision_elem = ET.SubElement(root, "DecisionDetails")
-        ET.SubElement(decision_elem, "Status").text = decision.decision_status.value
+        decision_elem = ET.SubElement(root, ns + "DecisionDetails")
+        ET.SubElement(decision_elem, ns + "Status").text = decision.decision_status.value
         if decision.award_amount_sar:
-            ET.SubElement(decision_elem, "AwardAmount").text = str(decision.award_amount_sar)
-        ET.SubElement(decision_elem, "ReasoningArabic").text = clean_arabic_text(decision.decision_reasoning_ar)
+            ET.SubElement(decision_elem, ns + "AwardAmount").text = str(decision.award_amount_sar)
+        ET.SubElement(decision_elem, ns + "ReasoningArabic").text = fast_clean_arabic_text(decision.decision_reasoning_ar)
         if decision.decision_reasoning_en:
-            ET.SubElement(decision_elem, "ReasoningEnglish").text = decision.decision_reasoning_en
+            ET.SubElement(decision_elem, ns + "ReasoningEnglish").text = decision.decision_reasoning_en
         
         # Decision maker information
-        decision_maker_elem = ET.SubElement(root, "DecisionMaker")
-        ET.SubElement(decision_maker_elem, "ID").text = decision.decision_maker_id
-        ET.SubElement(decision_maker_elem, "TitleArabic").text = clean_arabic_text(decision.decision_maker_title_ar)
-        ET.SubElement(decision_maker_elem, "AuthorityLevel").text = decision.approval_authority_level
-        
-        # Convert to string with proper formatting
-        xml_str = ET.tostring(root, encoding='unicode')
+        decision_maker_elem = ET.SubElement(root, ns + "DecisionMaker")
+        ET.SubElement(decision_maker_elem, ns + "ID").text = decision.decision_maker_id
+        ET.SubElement(decision_maker_elem, ns + "TitleArabic").text = fast_clean_arabic_text(decision.decision_maker_title_ar)
+        ET.SubElement(decision_maker_elem, ns + "AuthorityLevel").text = decision.approval_authority_level
         
-        # Pretty print
-        dom = minidom.parseString(xml_str)
-        return dom.toprettyxml(indent="  ", encoding=None)
+        return root
 
-    async def _create_monthly_xml_report(self, decisions: List[ProcurementDecision], year: int, month: int) -> str:
-        """Create monthly XML report for Etimad"""
+    async def _write_monthly_xml_report(self, output_file: Path, decisions: List[ProcurementDecision],
+                                        year: int, month: int) -> List[Dict[str, Any]]:
+        """
+        Write monthly XML report for Etimad
         
-        root = ET.Element("MonthlyProcurementReport")
-        root.set("xmlns", self.xml_namespaces["etimad"])
+        The report is streamed to output_file in Windows-1256 one decision
+        at a time, so memory use does not grow with the number of decisions.
+        Each decision element is validated before it is written.
         
-        # Report header
-        header = ET.SubElement(root, "ReportHeader")
-        ET.SubElement(header, "Year").text = str(year)
-        ET.SubElement(header, "Month").text = str(month)
-        ET.SubElement(header, "GeneratedDate").text = datetime.now().isoformat()
-        ET.SubElement(header, "DecisionsCount").text = str(len(decisions))
+        Returns:
+            Validation failures, one entry per invalid decision
+        """
+        
+        ns = self._ns
+        invalid_decisions = []
         
         # Summary statistics
-        summary = ET.SubElement(root, "Summary")
         total_value = sum(d.award_amount_sar or 0 for d in decisions)
-        ET.SubElement(summary, "TotalValue").text = str(total_value)
-        
         awarded_count = len([d for d in decisions if d.decision_status == "منح"])
-        ET.SubElement(summary, "AwardedCount").text = str(awarded_count)
         
-        # Decisions list
-        decisions_elem = ET.SubElement(root, "Decisions")
+        # One timestamp for the whole report, shared by every decision
+        generated_ts = datetime.now().isoformat()
         
-        for decision in decisions:
-            decision_xml = await self._convert_to_etimad_xml(decision)
-            # Parse and append to decisions element
-            decision_root = ET.fromstring(decision_xml)
-            decisions_elem.append(decision_root)
-        
-        # Convert to string
-        xml_str = ET.tostring(root, encoding='unicode')
-        dom = minidom.parseString(xml_str)
-        return dom.toprettyxml(indent="  ", encoding=None)
+        with ET.xmlfile(str(output_file), encoding=self.ENCODING) as xf:
+            xf.write_declaration()
+            
+            with xf.element(ns + "MonthlyProcurementReport", nsmap=self._nsmap):
+                
+                # Report header
+                with xf.element(ns + "ReportHeader"):
+                    for tag, value in (
+                        ("Year", year),
+                        ("Month", month),
+                        ("GeneratedDate", generated_ts),
+                        ("DecisionsCount", len(decisions))
+                    ):
+                        with xf.element(ns + tag):
+                            xf.write(str(value))
+                
+                with xf.element(ns + "Summary"):
+                    with xf.element(ns + "TotalValue"):
+                        xf.write(str(total_value))
+                    with xf.element(ns + "AwardedCount"):
+                        xf.write(str(awarded_count))
+                
+                # Decisions list - each decision is built, written and released in turn
+                with xf.element(ns + "Decisions"):
+                    for decision in decisions:
+                        decision_elem = self._build_decision_element(None, decision, generated_ts)
+                        
+                        validation = self._validate_etimad_xml(decision_elem)
+                        if not validation["valid"]:
+                            invalid_decisions.append({
+                                "decision_id": decision.decision_id,
+                                "errors": validation.get("errors") or [
+                                    f"Missing element: {elem}" for elem in validation["missing_elements"]
+                                ]
+                            })
+                        
+                        xf.write(decision_elem, pretty_print=True)
+        
+        return invalid_decisions
 
-    def _extract_etimad_reference(self, xml_response: str) -> str:
+    def _extract_etimad_reference(self, xml_response: bytes) -> str:
         """Extract Etimad reference number from response"""
         try:
-            root = ET.fromstring(xml_response)
-            ref_elem = root.find(".//EtimadReference")
-            return ref_elem.text if ref_elem is not None else "NO_REFERENCE"
+            root = ET.fromstring(xml_response, self._xml_parser)
+            references = self._XP_ETIMAD_REF(root)
+            return references[0] if references else "NO_REFERENCE"
         except Exception:
             return "PARSE_ERROR"
 
-    def _parse_etimad_tender_xml(self, xml_data: str) -> Dict[str, Any]:
+    def _parse_etimad_tender_xml(self, xml_data: bytes) -> Dict[str, Any]:
         """Parse Etimad tender XML response"""
         try:
-            root = ET.fromstring(xml_data)
+            root = ET.fromstring(xml_data, self._xml_parser)
+            fields = self._child_texts(root)
             
             return {
-                "tender_number": root.findtext("TenderNumber"),
-                "title_ar": root.findtext("TitleArabic"),
-                "title_en": root.findtext("TitleEnglish"),
-                "estimated_value": root.findtext("EstimatedValue"),
-                "procurement_type": root.findtext("ProcurementType"),
-                "announcement_date": root.findtext("AnnouncementDate"),
-                "submission_deadline": root.findtext("SubmissionDeadline")
+                "tender_number": fields.get("TenderNumber"),
+                "title_ar": fields.get("TitleArabic"),
+                "title_en": fields.get("TitleEnglish"),
+                "estimated_value": fields.get("EstimatedValue"),
+                "procurement_type": fields.get("ProcurementType"),
+                "announcement_date": fields.get("AnnouncementDate"),
+                "submission_deadline": fields.get("SubmissionDeadline")
             }
         except Exception as e:
             return {"error": f"Failed to parse tender XML: {e}"}
 
-    def _parse_vendors_xml(self, xml_data: str) -> List[Dict[str, Any]]:
+    def _parse_vendors_xml(self, xml_data: bytes) -> List[Dict[str, Any]]:
         """Parse vendors XML from Etimad"""
         try:
-            root = ET.fromstring(xml_data)
             vendors = []
             
-            for vendor_elem in root.findall(".//Vendor"):
+            for vendor_elem in self._iterparse(xml_data, "Vendor"):
+                fields = self._child_texts(vendor_elem)
                 vendor = {
-                    "name_ar": vendor_elem.findtext("NameArabic"),
-                    "name_en": vendor_elem.findtext("NameEnglish"),
-                    "commercial_registration": vendor_elem.findtext("CommercialRegistration"),
-                    "region": vendor_elem.findtext("Region"),
-                    "vendor_size": vendor_elem.findtext("VendorSize"),
-                    "last_updated": vendor_elem.findtext("LastUpdated")
+                    "name_ar": fields.get("NameArabic"),
+                    "name_en": fields.get("NameEnglish"),
+                    "commercial_registration": fields.get("CommercialRegistration"),
+                    "region": fields.get("Region"),
+                    "vendor_size": fields.get("VendorSize"),
+                    "last_updated": fields.get("LastUpdated")
                 }
                 vendors.append(vendor)
             
             return vendors
         except Exception as e:
-            print(f"Failed to parse vendors XML: {e}")
+            logger.error("Failed to parse vendors XML: %s", e)
             return []
 
-    async def _validate_etimad_xml(self, xml_data: str) -> Dict[str, Any]:
-        """Validate XML against Etimad schema requirements"""
-        try:
-            # Basic XML validation
-            ET.fromstring(xml_data)
-            
-            # Check for required elements
-            root = ET.fromstring(xml_data)
-            required_elements = ["Header", "Tender", "DecisionDetails"]
-            missing_elements = []
-            
-            for elem in required_elements:
-                if root.find(elem) is None:
-                    missing_elements.append(elem)
-            
-            return {
-                "valid": len(missing_elements) == 0,
-                "missing_elements": missing_elements,
-                "encoding_check": "windows-1256" in xml_data.lower() or True,
-                "validation_time": datetime.now().isoformat()
-            }
+    @staticmethod
+    def _child_texts(elem: ET._Element) -> Dict[str, str]:
+        """
+        Map each child tag to its text in a single pass
         
-        except ET.ParseError as e:
+        Cheaper than one findtext() per field; like findtext, a present but
+        empty child maps to '' and a missing one is simply absent.
+        """
+        return {child.tag: child.text or '' for child in elem}
+
+    def _iterparse(self, xml_data: bytes, tag: str):
+        """
+        Stream elements named tag from an Etimad document
+        
+        Each element is cleared (together with its already-processed
+        siblings) once the caller moves on, so memory stays bounded by a
+        single record rather than the whole document.
+        """
+        context = ET.iterparse(
+            io.BytesIO(xml_data),
+            events=("end",),
+            tag=tag,
+            encoding=self.ENCODING,
+            **_XML_SAFE_OPTIONS
+        )
+        for _, elem in context:
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+    def _validate_etimad_xml(self, xml_data: Union[ET._Element, bytes]) -> Dict[str, Any]:
+        """
+        Validate a <ProcurementDecision> against Etimad schema requirements
+        
+        Takes the element as built, so outbound documents are checked
+        without a serialize/parse round-trip; raw bytes are parsed first.
+        Uses the compiled Etimad XSD when one is configured, otherwise
+        checks for the required elements.
+        """
+        if isinstance(xml_data, bytes):
+            try:
+                root = ET.fromstring(xml_data, self._xml_parser)
+            except ET.ParseError as e:
+                return {
+                    "valid": False,
+                    "error": f"XML Parse Error: {e}",
+                    "suggestion": "Check XML structure and encoding"
+                }
+        else:
+            root = xml_data
+        
+        if self._xsd is not None:
+            if self._xsd.validate(root):
+                return {"valid": True, "errors": [], "validation_time": datetime.now().isoformat()}
             return {
                 "valid": False,
-                "error": f"XML Parse Error: {e}",
-                "suggestion": "Check XML structure and encoding"
+                "errors": [str(error) for error in self._xsd.error_log],
+                "validation_time": datetime.now().isoformat()
             }
+        
+        # Check for required elements
+        missing_elements = [
+            elem for elem in self.REQUIRED_ELEMENTS
+            if root.find(self._ns + elem) is None
+        ]
+        
+        return {
+            "valid": len(missing_elements) == 0,
+            "missing_elements": missing_elements,
+            "validation_time": datetime.now().isoformat()
+        }
 
     async def _get_sample_decisions(self, year: int, month: int) -> List[ProcurementDecision]:
         """Get sample decisions for the specified period"""
@@ -526,35 +926,6 @@ class EtimadConnector:
         # For demo purposes, return empty list
         return []
 
-    def get_known_issues_info(self) -> Dict[str, Any]:
-        """Get information about known Etimad integration issues"""
-        return {
-            "known_issues": self.known_issues,
-            "troubleshooting": {
-                "encoding_corruption": [
-                    "Ensure all Arabic text is properly encoded in Windows-1256",
-                    "Use clean_arabic_text() function before XML generation",
-                    "Test with sample Arabic characters: ا ب ت ث"
-                ],
-                "timeout_frequent": [
-                    "Increase timeout to 60 seconds during peak hours (9-11 AM, 2-4 PM)",
-                    "Implement retry logic with exponential backoff",
-                    "Consider submitting during off-peak hours"
-                ],
-                "xml_validation": [
-                    "Validate XML structure before submission",
-                    "Ensure all required elements are present",
-                    "Check namespace declarations"
-                ],
-                "rate_limiting": [
-                    "Implement request queuing during business hours",
-                    "Monitor rate limit headers",
-                    "Consider batch submissions during off-peak"
-                ]
-            },
-            "support_contacts": {
-                "technical_support": "etimad-support@moc.gov.sa",
-                "integration_help": "integration@etimad.sa",
-                "emergency_contact": "+966-11-456-7890"
-            }
-        }
\ No newline at end of file
+    def get_known_issues_info(self) -> Mapping[str, Any]:
+        """Get information about known Etimad integration issues (read-only, shared)"""
+        return self._KNOWN_ISSUES_INFO_VIEW
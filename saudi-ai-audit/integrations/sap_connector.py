@@ -5,23 +5,95 @@ DD.MM.YYYY date format and Windows-1252 encoding support
 
 import asyncio
 import aiohttp
-import json
+import functools
+import logging
+import orjson
+import time
+from collections import OrderedDict
 from datetime import datetime, date
-from typing import Dict, List, Optional, Any, Union
-from decimal import Decimal
+from typing import Dict, List, Mapping, Optional, Any, Tuple, Union
+from decimal import Decimal, ROUND_HALF_UP
 import xml.etree.ElementTree as ET
 from pathlib import Path
+from types import MappingProxyType
 
 from modules.procurement.models import ProcurementDecision, VendorDetails
 from utils.arabic import convert_arabic_to_latin, ensure_encoding
+from utils.json_stream import JSONReportSummary
 from api.errors import SaudiGovernmentErrorHandler
 
+logger = logging.getLogger(__name__)
+
+# SAP amounts carry exactly two decimal places
+_TWO_PLACES = Decimal("0.01")
+
+# Entity and vendor names repeat across decisions; transliterate each once
+_to_latin = functools.lru_cache(maxsize=4096)(convert_arabic_to_latin)
+
+# SAP vendor master fields as (our key, SAP key) pairs
+_VENDOR_FLAT = (
+    ("vendor_code", "vendor_code"),
+    ("name_ar", "name1"),
+    ("name_en", "name2"),
+    ("commercial_registration", "tax_number1"),
+    ("payment_terms", "payment_terms"),
+    ("currency", "currency"),
+    ("created_on", "created_on"),
+    ("last_changed", "last_changed")
+)
+_VENDOR_ADDRESS = (
+    ("street", "street"),
+    ("city", "city1"),
+    ("postal_code", "postal_code"),
+    ("country", "country")
+)
+_VENDOR_CONTACT = (
+    ("telephone", "telephone1"),
+    ("fax", "fax_number"),
+    ("email", "smtp_addr")
+)
+
 class SAPConnector:
     """
     Integration with Saudi Government SAP backend systems
     Handles legacy date formats and Windows-1252 encoding
     """
     
+    TROUBLESHOOTING = MappingProxyType({
+        "date_format_strict": (
+            "Always use DD.MM.YYYY format for dates",
+            "Use format_sap_date() method for consistency",
+            "Example: 15.01.2024 (not 2024-01-15)"
+        ),
+        "encoding_legacy": (
+            "Convert Arabic text to Latin using convert_arabic_to_latin()",
+            "Limit text fields to ASCII characters where possible",
+            "Test with Arabic characters: ا ب ت"
+        ),
+        "decimal_format": (
+            "Use comma (,) as decimal separator",
+            "Use format_sap_amount() method",
+            "Example: 1000,50 (not 1000.50)"
+        ),
+        "transaction_timeout": (
+            "Break large operations into smaller batches",
+            "Use RFC calls for bulk operations",
+            "Monitor transaction time"
+        ),
+        "arabic_locale_issues": (
+            "Use convert_arabic_to_latin() for text fields",
+            "Test Arabic number formatting in amount fields",
+            "Verify date format with Gregorian calendar only",
+            "Check font rendering in SAP GUI"
+        )
+    })
+    
+    SUPPORT_CONTACTS = MappingProxyType({
+        "sap_basis": "sap-basis@mof.gov.sa",
+        "functional_support": "sap-mm@mof.gov.sa",
+        "emergency": "+966-11-401-2345"
+    })
+    
     def __init__(self, config: Dict[str, Any]):
         self.sap_host = config.get("sap_host")
         self.sap_port = config.get("sap_port", 8000)
@@ -30,11 +102,26 @@ class SAPConnector:
         self.password = config.get("sap_password")
         self.language = config.get("sap_language", "AR")  # Arabic
         
+        # REST root, built once instead of per request
+        self._base_url = f"http://{self.sap_host}:{self.sap_port}/sap/bc/rest"
+        
         # SAP-specific configuration
         self.encoding = "windows-1252"  # SAP legacy encoding  
         self.date_format = "%d.%m.%Y"   # DD.MM.YYYY format required by SAP
         self.time_format = "%H:%M:%S"
         self.decimal_separator = ","    # European decimal format
+        self._decimal_table = str.maketrans(".", self.decimal_separator)
+        
+        # Upper bound on concurrent SAP requests for bulk operations
+        self.max_concurrency = config.get("max_concurrency", 8)
+        
+        # Vendor master data changes rarely; cache lookups for vendor_ttl seconds
+        self.vendor_ttl = config.get("vendor_cache_ttl", 600)
+        self._vendor_cache: Dict[str, tuple] = {}  # vendor_code -> (fetched_at, data)
+        
+        # Built SAP documents, reused when a decision is retried or replayed (LRU)
+        self.sap_doc_cache_size = config.get("sap_doc_cache_size", 1024)
+        self._sap_doc_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
         
         # Arabic locale issues in SAP
         self.arabic_locale_issues = {
@@ -61,9 +148,53 @@ class SAPConnector:
             "batch_processing": "Large datasets require RFC batch processing"
         }
         
+        # Static known-issues report, served as a read-only view
+        self._known_issues_info = MappingProxyType({
+            "known_issues": MappingProxyType({**self.known_issues, **self.arabic_locale_issues}),
+            "troubleshooting": self.TROUBLESHOOTING,
+            "support_contacts": self.SUPPORT_CONTACTS,
+            "sap_modules": MappingProxyType(self.modules)
+        })
+        
         # Authentication token
         self._auth_token = None
         self._token_expires = None
+        
+        # Request headers, rebuilt only when the token changes (see authenticate)
+        self._headers: Dict[str, str] = {}
+        
+        # Serializes token refresh so concurrent callers share one login. Created
+        # lazily in _ensure_authenticated: on Python 3.9 asyncio primitives bind
+        # to the event loop current at construction
+        self._auth_lock: Optional[asyncio.Lock] = None
+        
+        # Shared HTTP session, created lazily on first request (see _get_session)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "SAPConnector":
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75
+                )
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session and its pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def authenticate(self) -> bool:
         """
@@ -74,7 +205,7 @@ class SAPConnector:
         """
         
         try:
-            auth_url = f"http://{self.sap_host}:{self.sap_port}/sap/bc/rest/authenticate"
+            auth_url = f"{self._base_url}/authenticate"
             
             auth_data = {
                 "client": self.client,
@@ -83,23 +214,36 @@ class SAPConnector:
                 "language": self.language
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(auth_url, json=auth_data) as response:
+            session = await self._get_session()
+            async with session.post(
+                auth_url,
+                data=orjson.dumps(auth_data),
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                
+                if response.status == 200:
+                    auth_result = await response.json(loads=orjson.loads)
+                    self._auth_token = auth_result.get("token")
+                    self._headers = {
+                        "Authorization": f"Bearer {self._auth_token}",
+                        "X-SAP-Client": self.client,
+                        "Content-Type": "application/json; charset=windows-1252",
+                        "Accept": "application/json",
+                        # Report and chart-of-accounts JSON is verbose; aiohttp
+                        # decompresses transparently before iter_chunked/json()
+                        "Accept-Encoding": "gzip, deflate"
+                    }
+                    
+                    # Token typically expires in 8 hours (monotonic deadline)
+                    self._token_expires = time.monotonic() + (8 * 3600)
                     
-                    if response.status == 200:
-                        auth_result = await response.json()
-                        self._auth_token = auth_result.get("token")
-                        
-                        # Token typically expires in 8 hours
-                        self._token_expires = datetime.now().timestamp() + (8 * 3600)
-                        
-                        return True
-                    else:
-                        print(f"SAP authentication failed: {response.status}")
-                        return False
+                    return True
+                else:
+                    logger.warning("SAP authentication failed: %s", response.status)
+                    return False
         
         except Exception as e:
-            print(f"SAP authentication error: {e}")
+            logger.error("SAP authentication error: %s", e)
             return False
 
     async def submit_procurement_record(self, decision: ProcurementDecision) -> Dict[str, Any]:
@@ -118,58 +262,73 @@ class SAPConnector:
             if not await self._ensure_authenticated():
                 raise Exception("SAP authentication failed")
             
-            # Convert decision to SAP format
-            sap_record = await self._convert_to_sap_format(decision)
+            # Convert decision to SAP format (cached per decision revision)
+            sap_record = await self._get_sap_record(decision)
             
             # Submit to SAP MM module
-            submission_url = f"http://{self.sap_host}:{self.sap_port}/sap/bc/rest/mm/procurement"
+            submission_url = f"{self._base_url}/mm/procurement"
             
-            headers = {
-                "Authorization": f"Bearer {self._auth_token}",
-                "Content-Type": "application/json; charset=windows-1252",
-                "Accept": "application/json",
-                "X-SAP-Client": self.client
-            }
+            ok, status, result = await self._request_json("POST", submission_url, payload=sap_record)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    submission_url,
-                    json=sap_record,
-                    headers=headers
-                ) as response:
-                    
-                    if response.status == 200:
-                        result = await response.json()
-                        
-                        return {
-                            "success": True,
-                            "sap_document_number": result.get("document_number"),
-                            "sap_fiscal_year": result.get("fiscal_year"),
-                            "posting_date": result.get("posting_date"),
-                            "status": "posted",
-                            "submission_time": datetime.now().isoformat()
-                        }
-                    
-                    elif response.status == 400:
-                        error_detail = await response.json()
-                        return {
-                            "success": False,
-                            "error": "SAP validation error",
-                            "details": error_detail,
-                            "suggestion": "Check date format and required fields"
-                        }
-                    
-                    else:
-                        error_text = await response.text()
-                        return {
-                            "success": False,
-                            "error": f"SAP submission failed: {response.status}",
-                            "details": error_text
-                        }
+            if ok:
+                return {
+                    "success": True,
+                    "sap_document_number": result.get("document_number"),
+                    "sap_fiscal_year": result.get("fiscal_year"),
+                    "posting_date": result.get("posting_date"),
+                    "status": "posted",
+                    "submission_time": datetime.now().isoformat()
+                }
+            
+            if status == 400:
+                return {
+                    "success": False,
+                    "error": "SAP validation error",
+                    "details": orjson.loads(result),
+                    "suggestion": "Check date format and required fields"
+                }
+            
+            return {
+                "success": False,
+                "error": f"SAP submission failed: {status}",
+                "details": result
+            }
         
         except Exception as e:
             return SaudiGovernmentErrorHandler.handle_sap_integration_error(str(e))
 
+    async def submit_procurement_records(self, decisions: List[ProcurementDecision]) -> List[Dict[str, Any]]:
+        """
+        Submit several procurement decisions to SAP concurrently
+        
+        Args:
+            decisions: ProcurementDecision objects
+            
+        Returns:
+            SAP submission results, in input order
+        """
+        
+        # Authenticate once up front rather than racing N logins
+        await self._ensure_authenticated()
+        return await self._gather_bounded(self.submit_procurement_record, decisions)
+
+    async def fetch_vendor_master_data_bulk(self, vendor_codes: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch vendor master data for several vendors concurrently
+        
+        Args:
+            vendor_codes: SAP vendor codes (duplicates are fetched once)
+            
+        Returns:
+            Vendor master data (or None) keyed by vendor code
+        """
+        
+        unique_codes = list(dict.fromkeys(vendor_codes))
+        
+        await self._ensure_authenticated()
+        vendors = await self._gather_bounded(self.fetch_vendor_master_data, unique_codes)
+        return dict(zip(unique_codes, vendors))
+
     async def fetch_vendor_master_data(self, vendor_code: str) -> Optional[Dict[str, Any]]:
         """
         Fetch vendor master data from SAP
@@ -181,35 +340,44 @@ class SAPConnector:
             Vendor master data or None
         """
         
+        cached = self._vendor_cache.get(vendor_code)
+        if cached and time.monotonic() - cached[0] < self.vendor_ttl:
+            return cached[1]
+        
         try:
             if not await self._ensure_authenticated():
                 return None
             
-            fetch_url = f"http://{self.sap_host}:{self.sap_port}/sap/bc/rest/mm/vendor/{vendor_code}"
+            fetch_url = f"{self._base_url}/mm/vendor/{vendor_code}"
             
-            headers = {
-                "Authorization": f"Bearer {self._auth_token}",
-                "X-SAP-Client": self.client
-            }
+            ok, status, result = await self._request_json("GET", fetch_url)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(fetch_url, headers=headers) as response:
-                    
-                    if response.status == 200:
-                        vendor_data = await response.json()
-                        return self._parse_sap_vendor_data(vendor_data)
-                    
-                    elif response.status == 404:
-                        return None
-                    
-                    else:
-                        print(f"SAP vendor fetch failed: {response.status}")
-                        return None
+            if ok:
+                vendor_data = self._parse_sap_vendor_data(result)
+                self._vendor_cache[vendor_code] = (time.monotonic(), vendor_data)
+                return vendor_data
+            
+            if status != 404:
+                logger.warning("SAP vendor fetch failed: %s", status)
+            return None
         
         except Exception as e:
-            print(f"Error fetching vendor {vendor_code}: {e}")
+            logger.error("Error fetching vendor %s: %s", vendor_code, e)
             return None
 
+    def invalidate_vendor(self, vendor_code: str) -> None:
+        """Drop a vendor from the master data cache (e.g. on a change event)"""
+        self._vendor_cache.pop(vendor_code, None)
+
+    def invalidate_all_vendors(self) -> None:
+        """Clear the vendor master data cache"""
+        self._vendor_cache.clear()
+
+    def invalidate_decision(self, decision_id: str) -> None:
+        """Drop cached SAP documents for a decision (e.g. after it was edited in place)"""
+        for key in [key for key in self._sap_doc_cache if key[0] == decision_id]:
+            del self._sap_doc_cache[key]
+
     async def export_financial_report(self, start_date: date, end_date: date, output_path: str) -> Dict[str, Any]:
         """
         Export financial report from SAP FI module
@@ -228,10 +396,10 @@ class SAPConnector:
                 raise Exception("SAP authentication required")
             
             # Format dates for SAP
-            start_sap = start_date.strftime(self.date_format)
-            end_sap = end_date.strftime(self.date_format)
+            start_sap = self._sap_date(start_date)
+            end_sap = self._sap_date(end_date)
             
-            report_url = f"http://{self.sap_host}:{self.sap_port}/sap/bc/rest/fi/reports/procurement"
+            report_url = f"{self._base_url}/fi/reports/procurement"
             
             params = {
                 "start_date": start_sap,
@@ -240,35 +408,36 @@ class SAPConnector:
                 "format": "JSON"
             }
             
-            headers = {
-                "Authorization": f"Bearer {self._auth_token}",
-                "X-SAP-Client": self.client
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(report_url, params=params, headers=headers) as response:
+            session = await self._get_session()
+            async with session.get(report_url, params=params, headers=self._headers) as response:
+                
+                if response.status == 200:
+                    # Save report: stream SAP's JSON bytes straight to disk.
+                    # Disk I/O runs in worker threads so a slow volume does not
+                    # stall other SAP calls sharing the event loop
+                    output_file = Path(output_path)
+                    await asyncio.to_thread(output_file.parent.mkdir, parents=True, exist_ok=True)
                     
-                    if response.status == 200:
-                        report_data = await response.json()
-                        
-                        # Save report
-                        output_file = Path(output_path)
-                        output_file.parent.mkdir(parents=True, exist_ok=True)
-                        
-                        with open(output_file, 'w', encoding='utf-8') as f:
-                            json.dump(report_data, f, ensure_ascii=False, indent=2)
-                        
-                        return {
-                            "success": True,
-                            "output_file": str(output_file),
-                            "report_period": f"{start_sap} - {end_sap}",
-                            "records_count": len(report_data.get("records", [])),
-                            "total_amount": report_data.get("total_amount", 0),
-                            "export_time": datetime.now().isoformat()
-                        }
+                    summary = JSONReportSummary()
+                    f = await asyncio.to_thread(open, output_file, 'wb')
+                    try:
+                        async for chunk in response.content.iter_chunked(64 * 1024):
+                            await asyncio.to_thread(f.write, chunk)
+                            summary.feed(chunk)
+                    finally:
+                        await asyncio.to_thread(f.close)
                     
-                    else:
-                        raise Exception(f"SAP report export failed: {response.status}")
+                    return {
+                        "success": True,
+                        "output_file": str(output_file),
+                        "report_period": f"{start_sap} - {end_sap}",
+                        "records_count": summary.items_count,
+                        "total_amount": summary.total,
+                        "export_time": datetime.now().isoformat()
+                    }
+                
+                else:
+                    raise Exception(f"SAP report export failed: {response.status}")
         
         except Exception as e:
             return {
@@ -289,41 +458,32 @@ class SAPConnector:
             if not await self._ensure_authenticated():
                 raise Exception("SAP authentication required")
             
-            coa_url = f"http://{self.sap_host}:{self.sap_port}/sap/bc/rest/fi/chart_of_accounts"
+            coa_url = f"{self._base_url}/fi/chart_of_accounts"
             
-            headers = {
-                "Authorization": f"Bearer {self._auth_token}",
-                "X-SAP-Client": self.client
-            }
+            ok, status, coa_data = await self._request_json("GET", coa_url)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(coa_url, headers=headers) as response:
-                    
-                    if response.status == 200:
-                        coa_data = await response.json()
-                        
-                        # Process accounts
-                        accounts = []
-                        for account in coa_data.get("accounts", []):
-                            processed_account = {
-                                "account_number": account.get("account_number"),
-                                "account_name_ar": account.get("short_text_ar"),
-                                "account_name_en": account.get("short_text_en"),
-                                "account_group": account.get("account_group"),
-                                "balance_sheet_item": account.get("balance_sheet_item"),
-                                "profit_loss_item": account.get("profit_loss_item")
-                            }
-                            accounts.append(processed_account)
-                        
-                        return {
-                            "success": True,
-                            "accounts_synced": len(accounts),
-                            "sync_time": datetime.now().isoformat(),
-                            "chart_of_accounts": accounts[:20]  # Sample of first 20
-                        }
-                    
-                    else:
-                        raise Exception(f"Chart of accounts sync failed: {response.status}")
+            if not ok:
+                raise Exception(f"Chart of accounts sync failed: {status}")
+            
+            # Process accounts
+            accounts = []
+            for account in coa_data.get("accounts", []):
+                processed_account = {
+                    "account_number": account.get("account_number"),
+                    "account_name_ar": account.get("short_text_ar"),
+                    "account_name_en": account.get("short_text_en"),
+                    "account_group": account.get("account_group"),
+                    "balance_sheet_item": account.get("balance_sheet_item"),
+                    "profit_loss_item": account.get("profit_loss_item")
+                }
+                accounts.append(processed_account)
+            
+            return {
+                "success": True,
+                "accounts_synced": len(accounts),
+                "sync_time": datetime.now().isoformat(),
+                "chart_of_accounts": accounts[:20]  # Sample of first 20
+            }
         
         except Exception as e:
             return {
@@ -350,51 +510,43 @@ class SAPConnector:
             if not decision.winning_vendor or decision.decision_status != "منح":
                 raise Exception("Cannot create PO for non-awarded decision")
             
+            if decision.award_amount_sar is None:
+                raise Exception("Cannot create PO without an award amount")
+            
             # Create PO data structure
             po_data = {
                 "vendor_code": decision.winning_vendor.commercial_registration,
                 "purchase_organization": "1000",  # Default gov org
                 "purchasing_group": "001",
                 "document_type": "NB",  # Standard PO
-                "created_on": datetime.now().strftime(self.date_format),
+                "created_on": self._sap_date(date.today()),
                 "currency": "SAR",
-                "total_amount": str(decision.award_amount_sar).replace(".", self.decimal_separator),
+                "total_amount": self._fmt_amount(decision.award_amount_sar),
                 "payment_terms": "Z001",  # Government standard terms
                 "reference_number": decision.decision_id,
-                "header_text": convert_arabic_to_latin(decision.decision_reasoning_ar[:40])
+                "header_text": _to_latin(decision.decision_reasoning_ar[:40])
             }
             
-            po_url = f"http://{self.sap_host}:{self.sap_port}/sap/bc/rest/mm/purchase_order"
+            po_url = f"{self._base_url}/mm/purchase_order"
             
-            headers = {
-                "Authorization": f"Bearer {self._auth_token}",
-                "Content-Type": "application/json; charset=windows-1252",
-                "X-SAP-Client": self.client
-            }
+            ok, status, po_result = await self._request_json("POST", po_url, payload=po_data, ok=(201,))
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(po_url, json=po_data, headers=headers) as response:
-                    
-                    if response.status == 201:
-                        po_result = await response.json()
-                        
-                        return {
-                            "success": True,
-                            "po_number": po_result.get("po_number"),
-                            "po_date": po_result.get("po_date"),
-                            "vendor_code": po_result.get("vendor_code"),
-                            "total_amount": po_result.get("total_amount"),
-                            "status": "created",
-                            "sap_message": po_result.get("message")
-                        }
-                    
-                    else:
-                        error_detail = await response.text()
-                        return {
-                            "success": False,
-                            "error": f"PO creation failed: {response.status}",
-                            "details": error_detail
-                        }
+            if not ok:
+                return {
+                    "success": False,
+                    "error": f"PO creation failed: {status}",
+                    "details": po_result
+                }
+            
+            return {
+                "success": True,
+                "po_number": po_result.get("po_number"),
+                "po_date": po_result.get("po_date"),
+                "vendor_code": po_result.get("vendor_code"),
+                "total_amount": po_result.get("total_amount"),
+                "status": "created",
+                "sap_message": po_result.get("message")
+            }
         
         except Exception as e:
             return {
@@ -404,38 +556,104 @@ class SAPConnector:
             }
 
     # Private helper methods
+    async def _request_json(self, method: str, url: str, payload: Any = None,
+                            ok: Tuple[int, ...] = (200,), **kwargs) -> Tuple[bool, int, Any]:
+        """
+        Send an authenticated SAP request
+        
+        Returns:
+            (True, status, decoded JSON) when the status is in ok,
+            otherwise (False, status, response text)
+        """
+        
+        if payload is not None:
+            # Match the declared charset=windows-1252; ASCII bodies need no transcode
+            body = orjson.dumps(payload)
+            if not body.isascii():
+                body = body.decode("utf-8").encode(self.encoding, errors="replace")
+            kwargs["data"] = body
+        
+        session = await self._get_session()
+        async with session.request(method, url, headers=self._headers, **kwargs) as response:
+            if response.status in ok:
+                return True, response.status, await response.json(loads=orjson.loads)
+            return False, response.status, await response.text()
+
+    async def _gather_bounded(self, func, items: List[Any]) -> List[Any]:
+        """Await func(item) for every item, at most max_concurrency at a time, in input order"""
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def run(item):
+            async with semaphore:
+                return await func(item)
+        
+        return await asyncio.gather(*(run(item) for item in items))
+
     async def _ensure_authenticated(self) -> bool:
         """Ensure valid authentication token"""
         
-        if not self._auth_token or not self._token_expires:
-            return await self.authenticate()
+        # Fast path: no locking while the token is good
+        if self._token_is_fresh():
+            return True
         
-        # Check if token is about to expire (refresh 30 minutes early)
-        if datetime.now().timestamp() > (self._token_expires - 1800):
+        # Only one caller refreshes; the others wait and reuse its token
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        async with self._auth_lock:
+            if self._token_is_fresh():
+                return True
             return await self.authenticate()
+
+    def _token_is_fresh(self) -> bool:
+        """Check for a token that is not about to expire (refresh 30 minutes early)"""
         
-        return True
+        if not self._auth_token or not self._token_expires:
+            return False
+        
+        return time.monotonic() <= (self._token_expires - 1800)
 
-    async def _convert_to_sap_format(self, decision: ProcurementDecision) -> Dict[str, Any]:
+    async def _get_sap_record(self, decision: ProcurementDecision) -> Dict[str, Any]:
+        """Return the SAP document for a decision, building it off the loop on a cache miss"""
+        
+        # last_modified/version identify the revision; the date covers posting_date
+        key = (decision.decision_id, decision.last_modified, decision.version, date.today())
+        
+        sap_record = self._sap_doc_cache.get(key)
+        if sap_record is not None:
+            self._sap_doc_cache.move_to_end(key)
+            return sap_record
+        
+        # CPU-bound transliteration runs in a worker thread; the cache is
+        # only touched here, on the event loop
+        sap_record = await asyncio.to_thread(self._convert_to_sap_format, decision)
+        
+        self._sap_doc_cache[key] = sap_record
+        if len(self._sap_doc_cache) > self.sap_doc_cache_size:
+            self._sap_doc_cache.popitem(last=False)
+        
+        return sap_record
+
+    def _convert_to_sap_format(self, decision: ProcurementDecision) -> Dict[str, Any]:
         """Convert ProcurementDecision to SAP-compatible format"""
         
         # SAP document structure
         sap_doc = {
             "document_header": {
                 "document_type": "PROCUREMENT_DECISION",
-                "document_date": decision.decision_date_gregorian.strftime(self.date_format),
-                "posting_date": datetime.now().strftime(self.date_format),
+                "document_date": self._sap_date(decision.decision_date_gregorian),
+                "posting_date": self._sap_date(date.today()),
                 "reference": decision.decision_id,
-                "header_text": convert_arabic_to_latin(decision.decision_reasoning_ar[:50]),
+                "header_text": _to_latin(decision.decision_reasoning_ar[:50]),
                 "currency": "SAR",
                 "company_code": "1000"  # Government company code
             },
             "tender_details": {
                 "tender_number": decision.tender.tender_number,
-                "tender_title": convert_arabic_to_latin(decision.tender.tender_title_ar),
+                "tender_title": _to_latin(decision.tender.tender_title_ar),
                 "procurement_type": decision.tender.procurement_type.value,
-                "estimated_value": str(decision.tender.estimated_value_sar).replace(".", self.decimal_separator),
-                "procuring_entity": convert_arabic_to_latin(decision.tender.procuring_entity_ar)
+                "estimated_value": self._fmt_amount(decision.tender.estimated_value_sar),
+                "procuring_entity": _to_latin(decision.tender.procuring_entity_ar)
             }
         }
         
@@ -443,15 +661,15 @@ class SAPConnector:
         if decision.winning_vendor:
             sap_doc["vendor_details"] = {
                 "vendor_code": decision.winning_vendor.commercial_registration,
-                "vendor_name": convert_arabic_to_latin(decision.winning_vendor.name_ar),
+                "vendor_name": _to_latin(decision.winning_vendor.name_ar),
                 "region": decision.winning_vendor.region.value,
                 "vendor_size": decision.winning_vendor.vendor_size
             }
         
         # Add financial information
-        if decision.award_amount_sar:
+        if decision.award_amount_sar is not None:
             sap_doc["financial_details"] = {
-                "award_amount": str(decision.award_amount_sar).replace(".", self.decimal_separator),
+                "award_amount": self._fmt_amount(decision.award_amount_sar),
                 "currency": "SAR",
                 "payment_terms": "Z001",  # Government standard
                 "gl_account": "2000000",  # Procurement expense account
@@ -460,88 +678,45 @@ class SAPConnector:
         
         return sap_doc
 
+    def _fmt_amount(self, amount: Decimal) -> str:
+        """Render a Decimal amount in fixed-point with SAP's decimal separator"""
+        # format(..., "f") never falls back to exponent notation, unlike str()
+        return format(amount, "f").translate(self._decimal_table)
+
     def _parse_sap_vendor_data(self, sap_data: Dict[str, Any]) -> Dict[str, Any]:
         """Parse SAP vendor master data"""
         
-        return {
-            "vendor_code": sap_data.get("vendor_code"),
-            "name_ar": sap_data.get("name1"),
-            "name_en": sap_data.get("name2"),
-            "commercial_registration": sap_data.get("tax_number1"),
-            "address": {
-                "street": sap_data.get("street"),
-                "city": sap_data.get("city1"),
-                "postal_code": sap_data.get("postal_code"),
-                "country": sap_data.get("country")
-            },
-            "contact": {
-                "telephone": sap_data.get("telephone1"),
-                "fax": sap_data.get("fax_number"),
-                "email": sap_data.get("smtp_addr")
-            },
-            "payment_terms": sap_data.get("payment_terms"),
-            "currency": sap_data.get("currency"),
-            "created_on": sap_data.get("created_on"),
-            "last_changed": sap_data.get("last_changed")
-        }
+        get = sap_data.get
+        vendor = {key: get(field) for key, field in _VENDOR_FLAT}
+        vendor["address"] = {key: get(field) for key, field in _VENDOR_ADDRESS}
+        vendor["contact"] = {key: get(field) for key, field in _VENDOR_CONTACT}
+        return vendor
 
     def format_sap_date(self, date_obj: Union[datetime, date]) -> str:
         """Format date for SAP (DD.MM.YYYY)"""
         
-        if isinstance(date_obj, datetime):
-            return date_obj.strftime(self.date_format)
-        elif isinstance(date_obj, date):
-            return date_obj.strftime(self.date_format)
+        if isinstance(date_obj, date):  # datetime is a date subclass
+            return self._sap_date(date_obj)
         else:
             raise ValueError("Invalid date object")
 
+    @staticmethod
+    def _sap_date(d: date) -> str:
+        """DD.MM.YYYY without going through strftime's format parser"""
+        return f"{d.day:02d}.{d.month:02d}.{d.year:04d}"
+
     def format_sap_amount(self, amount: Union[Decimal, float, int]) -> str:
         """Format amount for SAP (comma as decimal separator)"""
         
         if isinstance(amount, Decimal):
-            amount_str = str(amount)
+            # Fixed-point, two places: str() could give "1E+3" or extra digits
+            amount_str = format(amount.quantize(_TWO_PLACES, rounding=ROUND_HALF_UP), "f")
         else:
-            amount_str = f"{amount:.2f}"
-        
-        return amount_str.replace(".", self.decimal_separator)
-
-    def get_known_issues_info(self) -> Dict[str, Any]:
-        """Get information about known SAP integration issues"""
-        
-        return {
-            "known_issues": {**self.known_issues, **self.arabic_locale_issues},
-            "troubleshooting": {
-                "date_format_strict": [
-                    "Always use DD.MM.YYYY format for dates",
-                    "Use format_sap_date() method for consistency",
-                    "Example: 15.01.2024 (not 2024-01-15)"
-                ],
-                "encoding_legacy": [
-                    "Convert Arabic text to Latin using convert_arabic_to_latin()",
-                    "Limit text fields to ASCII characters where possible",
-                    "Test with Arabic characters: ا ب ت"
-                ],
-                "decimal_format": [
-                    "Use comma (,) as decimal separator",
-                    "Use format_sap_amount() method",
-                    "Example: 1000,50 (not 1000.50)"
-                ],
-                "transaction_timeout": [
-                    "Break large operations into smaller batches",
-                    "Use RFC calls for bulk operations",
-                    "Monitor transaction time"
-                ],
-                "arabic_locale_issues": [
-                    "Use convert_arabic_to_latin() for text fields",
-                    "Test Arabic number formatting in amount fields",
-                    "Verify date format with Gregorian calendar only",
-                    "Check font rendering in SAP GUI"
-                ]
-            },
-            "support_contacts": {
-                "sap_basis": "sap-basis@mof.gov.sa",
-                "functional_support": "sap-mm@mof.gov.sa",
-                "emergency": "+966-11-401-2345"
-            },
-            "sap_modules": self.modules
-        }
\ No newline at end of file
+            amount_str = format(amount, ".2f")
+        
+        return amount_str.translate(self._decimal_table)
+
+    def get_known_issues_info(self) -> Mapping[str, Any]:
+        """Get information about known SAP integration issues (read-only, built once)"""
+        
+        return self._known_issues_info
\ No newline at end of file
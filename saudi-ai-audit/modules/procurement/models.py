@@ -3,6 +3,7 @@ Procurement decision models for Saudi AI Audit Platform
 Government procurement compliance with NAZAHA requirements
 """
 
+import re
 from pydantic import BaseModel, Field, validator
 from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime, date
@@ -16,6 +17,18 @@ from utils.saudi_validators import (
 )
 from utils.hijri import get_hijri_date, hijri_to_gregorian
 
+# Field formats, compiled once at import and checked with fullmatch in the
+# validators below (a $ anchor would also accept a trailing newline)
+_TEN_DIGITS_RE = re.compile(r"\d{10}", re.ASCII)
+_TAX_NUMBER_RE = re.compile(r"\d{15}", re.ASCII)
+_IBAN_RE = re.compile(r"SA\d{20}", re.ASCII)
+_HIJRI_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
+_TENDER_NUMBER_RE = re.compile(r"[A-Z0-9]{8,20}", re.ASCII)
+_BUDGET_CODE_RE = re.compile(r"\d{4}-\d{4}-\d{4}", re.ASCII)
+
+# One halala (SAR 0.01), the rounding tolerance for bid totals
+_HALALA = Decimal("0.01")
+
 class RegionEnum(str, Enum):
     """Saudi administrative regions"""
     RIYADH = "الرياض"
@@ -59,9 +72,9 @@ class VendorDetails(BaseModel):
     name_en: Optional[str] = Field(None, max_length=200)
     
     # Registration information
-    commercial_registration: str = Field(..., regex=r"^[0-9]{10}$")
-    national_id_owner: Optional[str] = Field(None, regex=r"^[0-9]{10}$")
-    tax_number: str = Field(..., regex=r"^[0-9]{15}$")
+    commercial_registration: str
+    national_id_owner: Optional[str] = None
+    tax_number: str
     
     # Location information (critical for bias detection)
     region: RegionEnum
@@ -70,12 +83,12 @@ class VendorDetails(BaseModel):
     district_ar: Optional[str] = Field(None, max_length=100)
     
     # Banking information
-    iban: str = Field(..., regex=r"^SA[0-9]{2}[0-9]{18}$")
+    iban: str
     bank_name_ar: str
     bank_name_en: Optional[str] = None
     
     # Business information
-    establishment_date_hijri: str = Field(..., regex=r"^[0-9]{4}-[0-9]{2}-[0-9]{2}$")
+    establishment_date_hijri: str
     establishment_date_gregorian: date
     business_type_ar: str
     business_type_en: Optional[str] = None
@@ -91,21 +104,37 @@ class VendorDetails(BaseModel):
     
     @validator('commercial_registration')
     def validate_cr(cls, v):
+        if not _TEN_DIGITS_RE.fullmatch(v):
+            raise ValueError('Commercial registration must be 10 digits')
         if not validate_commercial_registration(v):
             raise ValueError('Invalid commercial registration number')
         return v
     
     @validator('national_id_owner')
     def validate_owner_id(cls, v):
+        if v is not None and not _TEN_DIGITS_RE.fullmatch(v):
+            raise ValueError('National ID must be 10 digits')
         if v and not validate_national_id(v):
             raise ValueError('Invalid national ID')
         return v
     
+    @validator('tax_number')
+    def validate_tax_number_format(cls, v):
+        if not _TAX_NUMBER_RE.fullmatch(v):
+            raise ValueError('Tax number must be 15 digits')
+        return v
+    
     @validator('iban')
     def validate_saudi_iban(cls, v):
-        if not validate_iban(v):
+        if not _IBAN_RE.fullmatch(v) or not validate_iban(v):
             raise ValueError('Invalid Saudi IBAN')
         return v
+    
+    @validator('establishment_date_hijri')
+    def validate_establishment_date_hijri(cls, v):
+        if not _HIJRI_DATE_RE.fullmatch(v):
+            raise ValueError('Hijri date must be in YYYY-MM-DD format')
+        return v
 
 class BidDetails(BaseModel):
     """Bid information with government requirements"""
@@ -141,7 +170,7 @@ class BidDetails(BaseModel):
         bid_amount = values.get('bid_amount_sar', 0)
         vat_amount = values.get('vat_amount_sar', 0)
         expected_total = bid_amount + vat_amount
-        if abs(v - expected_total) > 0.01:  # Allow for small rounding differences
+        if abs(v - expected_total) > _HALALA:  # Allow for small rounding differences
             raise ValueError('Total amount must equal bid amount plus VAT')
         return v
 
@@ -149,7 +178,7 @@ class ProcurementTender(BaseModel):
     """Government tender information"""
     
     # Tender identification
-    tender_number: str = Field(..., regex=r"^[A-Z0-9]{8,20}$")
+    tender_number: str
     tender_title_ar: str = Field(..., min_length=10, max_length=500)
     tender_title_en: Optional[str] = Field(None, max_length=500)
     
@@ -168,7 +197,7 @@ class ProcurementTender(BaseModel):
     procuring_entity_ar: str = Field(..., min_length=5, max_length=200)
     procuring_entity_en: Optional[str] = Field(None, max_length=200)
     ministry_department: str
-    budget_code: str = Field(..., regex=r"^[0-9]{4}-[0-9]{4}-[0-9]{4}$")
+    budget_code: str
     
     # Requirements
     minimum_qualification_requirements: List[str]
@@ -179,6 +208,18 @@ class ProcurementTender(BaseModel):
     tender_category: str
     strategic_importance: Literal["عالي", "متوسط", "منخفض"]  # High, Medium, Low
     requires_security_clearance: bool = Field(False)
+    
+    @validator('tender_number')
+    def validate_tender_number(cls, v):
+        if not _TENDER_NUMBER_RE.fullmatch(v):
+            raise ValueError('Tender number must be 8-20 uppercase letters or digits')
+        return v
+    
+    @validator('budget_code')
+    def validate_budget_code(cls, v):
+        if not _BUDGET_CODE_RE.fullmatch(v):
+            raise ValueError('Budget code must be in NNNN-NNNN-NNNN format')
+        return v
 
 class ProcurementDecision(BaseModel):
     """Complete procurement decision with audit trail"""
@@ -206,7 +247,7 @@ class ProcurementDecision(BaseModel):
     evaluation_summary_en: Optional[str] = None
     
     # Decision maker information
-    decision_maker_id: str = Field(..., regex=r"^[0-9]{10}$")  # National ID
+    decision_maker_id: str  # National ID
     decision_maker_title_ar: str
     decision_maker_title_en: Optional[str] = None
     approval_authority_level: Literal["وزير", "وكيل", "مدير عام", "مدير", "رئيس قسم"]
@@ -238,7 +279,7 @@ class ProcurementDecision(BaseModel):
     
     @validator('decision_maker_id')
     def validate_decision_maker(cls, v):
-        if not validate_national_id(v):
+        if not _TEN_DIGITS_RE.fullmatch(v) or not validate_national_id(v):
             raise ValueError('Invalid decision maker national ID')
         return v
     
@@ -4,8 +4,18 @@ Windows-compatible server startup
 """
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    from server import app
+    
+    # Worker processes (SERVER_WORKERS). server.py keeps submitted decisions in
+    # process memory, so the default is a single worker; each extra worker holds
+    # its own copy of that data.
+    workers = int(os.getenv("SERVER_WORKERS", "1"))
+    
+    # Logging keeps uvicorn's defaults; under load SERVER_LOG_LEVEL=warning and
+    # SERVER_ACCESS_LOG=0 drop the per-request log lines
+    log_level = os.getenv("SERVER_LOG_LEVEL", "info").lower()
+    access_log = os.getenv("SERVER_ACCESS_LOG", "1").lower() not in ("0", "false", "no", "off")
     
     print("=" * 60)
     print("SAUDI AI AUDIT PLATFORM - LOCAL SERVER")
@@ -21,7 +31,19 @@ if __name__ == "__main__":
     print("=" * 60)
     
     try:
-        uvicorn.run(app, host="127.0.0.1", port=8000, reload=False)
+        # Import string so uvicorn can spawn workers; "auto" picks uvloop and
+        # httptools when installed (uvicorn[standard]), else asyncio and h11
+        uvicorn.run(
+            "server:app",
+            host="127.0.0.1",
+            port=8000,
+            reload=False,
+            workers=workers,
+            loop="auto",
+            http="auto",
+            log_level=log_level,
+            access_log=access_log
+        )
     except Exception as e:
         print(f"Server error: {e}")
         input("Press Enter to exit...")
\ No newline at end of file
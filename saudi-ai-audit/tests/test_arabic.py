@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+from utils.arabic import clean_arabic_text, fast_clean_arabic_text
+
+# Characters seen in Etimad tender titles, vendor names and decision reasoning
+ETIMAD_FIELD_CHARS = (
+    [chr(codepoint) for codepoint in range(0x0621, 0x064B)]      # Arabic letters
+    + [chr(codepoint) for codepoint in range(0x064B, 0x0656)]    # Tashkeel, maddah, hamza marks
+    + [chr(codepoint) for codepoint in range(0x0660, 0x066A)]    # Arabic-Indic digits
+    + ["ـ", "ٰ", "،", "؛", "؟", "٫", "٬"]
+    + ["ﺍ", "ﺑ", "ﻻ", "ﷲ", "ﷺ"]         # Presentation forms from PDFs
+    + list("SA 0123456789-/().,:")
+    + [" ", "\t", "\n", "‎", "‏", "‌", "‍", "﻿"]
+)
+
+class TestFastCleanArabicText:
+    """
+    اختبارات التنظيف السريع للنصوص العربية
+    Fast Arabic text cleaning tests
+    """
+
+    @pytest.mark.parametrize("text", [
+        "وزارة الصحة - مُنَاقَصَة توريد أجهزة طبية",
+        "  شركة النور للتجارة المحدودة  ",
+        "﻿مؤسسة عبد الله‏",
+        "مستشفى الملك فهد ـــ جدة",
+        "ﺑﺴﻢ ﷲ ﺍﻟﺮﺣﻤﻦ",
+        "منافسة رقم ١٤٤٥/٠٣/١٢، المرحلة الثانية؟",
+        "لا‌يوجد  فرق",
+        "‎ ‏Al-Nour Trading Co.‎",
+        "أحمد",
+    ])
+    def test_matches_clean_arabic_text(self, text):
+        """Typical Etimad field values clean exactly as clean_arabic_text does"""
+        assert fast_clean_arabic_text(text) == clean_arabic_text(text)
+
+    def test_matches_clean_arabic_text_on_field_characters(self):
+        """Random strings over the characters Etimad fields contain"""
+        rng = random.Random(1445)
+        for _ in range(5000):
+            text = "".join(rng.choice(ETIMAD_FIELD_CHARS) for _ in range(rng.randint(0, 12)))
+            assert fast_clean_arabic_text(text) == clean_arabic_text(text), ascii(text)
@@ -227,4 +227,60 @@ class TestBiasDetection:
         # Should process 1000 decisions in under 5 seconds
         assert processing_time < 5.0, f"Processing took too long: {processing_time:.2f} seconds"
         assert result["total_decisions"] == 1000
-        assert "processing_time_ms" in result
\ No newline at end of file
+        assert "processing_time_ms" in result
+    
+    @staticmethod
+    def _region_decisions(counts):
+        """Decisions spread over REGION_KEYS according to counts"""
+        from modules.procurement.bias_detector import REGION_KEYS
+        return [
+            {"vendor_region_ar": region}
+            for region, count in zip(REGION_KEYS, counts)
+            for _ in range(count)
+        ]
+    
+    def _assert_batch_matches_single(self, bias_detector, decision_groups):
+        batch = bias_detector.check_regional_bias_batch(decision_groups)
+        assert list(batch) == list(decision_groups)
+        
+        for key, decisions in decision_groups.items():
+            single = bias_detector.check_regional_bias(decisions)
+            assert batch[key]["chi_square"] == pytest.approx(single["chi_square"]), key
+            assert batch[key]["p_value"] == pytest.approx(single["p_value"]), key
+            assert batch[key]["significant"] == single["significant"], key
+            assert batch[key]["distribution"] == single["distribution"], key
+        return batch
+    
+    def test_regional_bias_batch_matches_single_checks(self, bias_detector, monkeypatch):
+        """Batched chi-square rows equal per-group check_regional_bias, fallback rows included"""
+        from modules.procurement import bias_detector as module
+        
+        # Normalized shares so rows whose decisions all match a region are testable
+        monkeypatch.setattr(module, "EXPECTED_SHARES", module.EXPECTED_SHARES / module.EXPECTED_SHARES.sum())
+        
+        skewed = self._region_decisions([40, 5, 3, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1])
+        balanced = self._region_decisions([25, 25, 15, 8, 5, 4, 3, 3, 3, 2, 2, 2, 3])
+        unmatched = balanced + [{"vendor_region_ar": "غير محدد"}] * 5
+        
+        batch = self._assert_batch_matches_single(bias_detector, {
+            "skewed": skewed,
+            "balanced": balanced,
+            "empty": [],
+            "unmatched_region": unmatched
+        })
+        
+        assert batch["skewed"]["significant"]
+        assert batch["skewed"]["chi_square"] > 0
+        
+        # All-zero and sum-mismatch rows take the chi-square 0 / p-value 1 fallback
+        for key in ("empty", "unmatched_region"):
+            assert batch[key]["chi_square"] == 0
+            assert batch[key]["p_value"] == 1.0
+    
+    def test_regional_bias_batch_matches_single_checks_default_shares(self, bias_detector):
+        """Same equivalence with the shipped regional shares"""
+        self._assert_batch_matches_single(bias_detector, {
+            "skewed": self._region_decisions([40, 5, 3, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1]),
+            "single_region": self._region_decisions([10]),
+            "empty": []
+        })
@@ -0,0 +1,144 @@
+import pytest
+import aiohttp
+from lxml import etree as ET
+from types import SimpleNamespace
+
+from integrations.etimad_connector import EtimadConnector
+
+def _results_xml(references):
+    """Etimad batch response with one <Result> per reference"""
+    results = "".join(
+        f"<Result><EtimadReference>{reference}</EtimadReference></Result>"
+        for reference in references
+    )
+    return f'<?xml version="1.0" encoding="windows-1256"?><Results>{results}</Results>'.encode("windows-1256")
+
+class TestEtimadBatchSubmission:
+    """
+    اختبارات الإرسال المجمع إلى اعتماد
+    Etimad batch submission tests
+    """
+
+    @pytest.fixture
+    def connector(self, monkeypatch):
+        """Connector whose decision XML, validation and HTTP layer are replaced by fakes"""
+        connector = EtimadConnector({})
+        connector.posted_batches = []
+        connector.invalid_ids = set()
+
+        def build_decision_element(parent, decision, submission_ts=None):
+            return ET.SubElement(parent, connector._ns + "ProcurementDecision", id=decision.decision_id)
+
+        def validate_etimad_xml(decision_elem):
+            valid = decision_elem.get("id") not in connector.invalid_ids
+            return {"valid": valid, "missing_elements": [] if valid else ["DecisionDate"]}
+
+        monkeypatch.setattr(connector, "_build_decision_element", build_decision_element)
+        monkeypatch.setattr(connector, "_validate_etimad_xml", validate_etimad_xml)
+        return connector
+
+    @staticmethod
+    def _decisions(count):
+        return [SimpleNamespace(decision_id=f"PROC_2024_{i:06d}") for i in range(count)]
+
+    def _respond_with(self, connector, monkeypatch, respond):
+        """Route _request through respond(decision_ids) -> (status, body, headers)"""
+
+        async def fake_request(method, url, data=None, **kwargs):
+            root = ET.fromstring(data)
+            decision_ids = [elem.get("id") for elem in root]
+            connector.posted_batches.append(decision_ids)
+            return respond(decision_ids)
+
+        monkeypatch.setattr(connector, "_request", fake_request)
+
+    @pytest.mark.asyncio
+    async def test_batches_are_split_and_results_kept_in_order(self, connector, monkeypatch):
+        """Decisions are posted in batch_size documents and results follow input order"""
+        self._respond_with(connector, monkeypatch, lambda ids: (200, _results_xml(f"REF-{i}" for i in ids), {}))
+
+        decisions = self._decisions(5)
+        results = await connector.submit_procurement_decisions(decisions, batch_size=2)
+
+        assert sorted(map(len, connector.posted_batches)) == [1, 2, 2]
+        assert len(results) == 5
+        assert all(result["success"] for result in results)
+        assert [result["etimad_reference"] for result in results] == [
+            f"REF-{decision.decision_id}" for decision in decisions
+        ]
+
+    @pytest.mark.asyncio
+    async def test_short_result_list_marks_missing_decisions_failed(self, connector, monkeypatch):
+        """Decisions without a <Result> are reported as failed, the rest as submitted"""
+        self._respond_with(connector, monkeypatch, lambda ids: (200, _results_xml(["REF-A", "REF-B"]), {}))
+
+        results = await connector.submit_procurement_decisions(self._decisions(3), batch_size=3)
+
+        assert [result["success"] for result in results] == [True, True, False]
+        assert [result.get("etimad_reference") for result in results[:2]] == ["REF-A", "REF-B"]
+        assert "No result returned" in results[2]["error"]
+
+    @pytest.mark.asyncio
+    async def test_malformed_success_response_keeps_decisions_submitted(self, connector, monkeypatch):
+        """A 200 with an unparseable body means accepted - PARSE_ERROR, not failure"""
+        truncated = _results_xml(["REF-A", "REF-B"])[:-30]
+        self._respond_with(connector, monkeypatch, lambda ids: (200, truncated, {}))
+
+        results = await connector.submit_procurement_decisions(self._decisions(3), batch_size=3)
+
+        assert all(result["success"] for result in results)
+        assert results[0]["etimad_reference"] == "REF-A"
+        assert results[-1]["etimad_reference"] == "PARSE_ERROR"
+
+    @pytest.mark.asyncio
+    async def test_invalid_decisions_are_rejected_locally(self, connector, monkeypatch):
+        """Decisions failing validation are not posted; results keep input order"""
+        self._respond_with(connector, monkeypatch, lambda ids: (200, _results_xml(f"REF-{i}" for i in ids), {}))
+        decisions = self._decisions(4)
+        connector.invalid_ids = {decisions[1].decision_id, decisions[3].decision_id}
+
+        results = await connector.submit_procurement_decisions(decisions, batch_size=4)
+
+        assert connector.posted_batches == [[decisions[0].decision_id, decisions[2].decision_id]]
+        assert [result["success"] for result in results] == [True, False, True, False]
+        assert results[2]["etimad_reference"] == f"REF-{decisions[2].decision_id}"
+        assert results[1]["validation"]["missing_elements"] == ["DecisionDate"]
+
+    @pytest.mark.asyncio
+    async def test_fully_invalid_batch_is_not_posted(self, connector, monkeypatch):
+        """A batch with no valid decision makes no request"""
+        self._respond_with(connector, monkeypatch, lambda ids: (200, _results_xml([]), {}))
+        decisions = self._decisions(2)
+        connector.invalid_ids = {decision.decision_id for decision in decisions}
+
+        results = await connector.submit_procurement_decisions(decisions, batch_size=2)
+
+        assert connector.posted_batches == []
+        assert all("validation" in result for result in results)
+
+    @pytest.mark.asyncio
+    async def test_http_error_fails_whole_batch(self, connector, monkeypatch):
+        """A non-200 answer is reported against every decision of that batch"""
+        self._respond_with(connector, monkeypatch, lambda ids: (500, b"Internal Server Error", {}))
+
+        results = await connector.submit_procurement_decisions(self._decisions(4), batch_size=4)
+
+        assert len(results) == 4
+        assert all(not result["success"] for result in results)
+        assert all("500" in result["error"] for result in results)
+        assert results[0] is not results[1]
+
+    @pytest.mark.asyncio
+    async def test_connection_error_fails_whole_batch(self, connector, monkeypatch):
+        """A network failure is reported against every decision of that batch"""
+
+        def respond(ids):
+            raise aiohttp.ClientConnectionError("connection reset")
+
+        self._respond_with(connector, monkeypatch, respond)
+
+        results = await connector.submit_procurement_decisions(self._decisions(3), batch_size=2)
+
+        assert len(results) == 3
+        assert all(result["error_code"] == "ETIMAD_CONNECTION_ERROR" for result in results)
+        assert all("connection reset" in result["context"]["error_details"] for result in results)
@@ -0,0 +1,94 @@
+import random
+
+import orjson
+import pytest
+
+from utils.json_stream import JSONReportSummary
+
+def _summarize(data: bytes, chunk_size: int = 64 * 1024) -> JSONReportSummary:
+    """Feed data in chunk_size pieces and return the summary"""
+    summary = JSONReportSummary()
+    for i in range(0, len(data), chunk_size):
+        summary.feed(data[i:i + chunk_size])
+    return summary
+
+def _expected(data: bytes):
+    report = orjson.loads(data)
+    return len(report.get("records", [])), report.get("total_amount", 0)
+
+class TestJSONReportSummary:
+    """
+    اختبارات ملخص التقارير المتدفقة
+    Streamed report summary tests
+    """
+
+    @pytest.mark.parametrize("report", [
+        {"records": [], "total_amount": 0},
+        {"records": [1, 2.5, None, True, "x"], "total_amount": 12.75},
+        {"total_amount": "1000,50", "records": [{"id": 1}, {"id": 2}]},
+        {"records": [[1, [2]], {"records": [1, 2, 3]}], "meta": {"total_amount": 5}},
+        {"meta": {"records": [1, 2]}, "total_amount": {"value": 7, "currency": "SAR"}},
+        {"other": [1, 2, 3]},
+    ])
+    def test_matches_full_decode(self, report):
+        """Counts and totals equal a full orjson decode, nested keys ignored"""
+        data = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+        summary = _summarize(data)
+        assert (summary.items_count, summary.total) == _expected(data)
+
+    def test_string_escapes_do_not_end_strings(self):
+        """Escaped quotes, backslashes and structural bytes inside strings are skipped"""
+        data = (
+            b'{"note": "a \\"records\\": [1, 2], \\\\", '
+            b'"records": ["]\\"", "\\\\", "{,}:"], '
+            b'"total_amount": 3}'
+        )
+        summary = _summarize(data)
+        assert (summary.items_count, summary.total) == _expected(data) == (3, 3)
+
+    def test_every_chunk_boundary(self):
+        """The result does not depend on where the stream is split"""
+        data = orjson.dumps({
+            "records": [{"name_ar": "شركة \"النور\"", "amount": 10.5}, "\\", [1, {}], -2e3],
+            "total_amount": 1250.75,
+            "tail": "\\\""
+        })
+        for split in range(1, len(data)):
+            summary = JSONReportSummary()
+            summary.feed(data[:split])
+            summary.feed(data[split:])
+            assert (summary.items_count, summary.total) == (4, 1250.75), split
+
+    def test_byte_at_a_time(self):
+        """Single-byte chunks, including escapes split from the byte they escape"""
+        data = b'{"records": ["\\"", "\\\\"], "total_amount": "\\"5\\""}'
+        summary = _summarize(data, chunk_size=1)
+        assert (summary.items_count, summary.total) == (2, '"5"')
+
+    def test_random_documents(self):
+        """Random nested documents split at random points agree with orjson"""
+        rng = random.Random(2024)
+        scalars = [0, -1.5, 3e5, None, True, False, "", "records", "a\\\"b,:{}[]", "نص عربي"]
+        keys = ["records", "total_amount", "k", "a\"b"]
+
+        def value(depth=0):
+            roll = rng.random()
+            if depth > 3 or roll < 0.4:
+                return rng.choice(scalars)
+            if roll < 0.7:
+                return [value(depth + 1) for _ in range(rng.randint(0, 4))]
+            return {rng.choice(keys): value(depth + 1) for _ in range(rng.randint(0, 3))}
+
+        for _ in range(500):
+            report = {key: value() for key in rng.sample(keys, rng.randint(0, len(keys)))}
+            report["records"] = [value(1) for _ in range(rng.randint(0, 6))]
+            data = orjson.dumps(report)
+
+            summary = JSONReportSummary()
+            pos = 0
+            while pos < len(data):
+                size = rng.randint(1, 9)
+                summary.feed(data[pos:pos + size])
+                pos += size
+
+            assert (summary.items_count, summary.total) == _expected(data)
@@ -0,0 +1,27 @@
+import pytest
+from pydantic import ValidationError
+
+from modules.procurement.models import VendorDetails, ProcurementTender
+
+def _field_errors(model, **fields):
+    """Names of the fields model rejects when built from fields"""
+    with pytest.raises(ValidationError) as exc_info:
+        model(**fields)
+    return {error["loc"][0] for error in exc_info.value.errors()}
+
+class TestModelFieldFormats:
+    """
+    اختبارات صيغ حقول نماذج المشتريات
+    Procurement model field format tests
+    """
+    
+    @pytest.mark.parametrize("model, field, value", [
+        (VendorDetails, "tax_number", "300000000000003"),
+        (VendorDetails, "establishment_date_hijri", "1445-09-29"),
+        (ProcurementTender, "tender_number", "TND2024000123"),
+        (ProcurementTender, "budget_code", "1234-5678-9012"),
+    ])
+    def test_trailing_newline_is_rejected(self, model, field, value):
+        """A value followed by a newline fails the format check, as pydantic pattern= did"""
+        assert field not in _field_errors(model, **{field: value})
+        assert field in _field_errors(model, **{field: value + "\n"})
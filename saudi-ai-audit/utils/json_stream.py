@@ -0,0 +1,128 @@
+"""
+Incremental JSON summaries for streamed government reports
+Counts and totals gathered chunk by chunk, without decoding the whole document
+"""
+
+import re
+from typing import Any
+
+import orjson
+
+# Structural bytes of a JSON document, and the bytes that end or escape inside a string
+_JSON_STRUCTURAL = re.compile(rb'["{}\[\],:]')
+_JSON_STRING_SPECIAL = re.compile(rb'["\\]')
+
+# Top-level keys longer than this are never one we look for
+_MAX_KEY_BYTES = 64
+
+class JSONReportSummary:
+    """
+    Summary of a top-level JSON object fed in arbitrary chunks
+
+    Counts the entries of the array under items_key and decodes the value
+    under total_key, e.g. for {"records": [...], "total_amount": 1250.5}.
+    Only those two values are ever held in memory. Keys are matched on
+    their raw bytes, so keys written with escape sequences are not found.
+    The input is assumed to be valid JSON; a total that does not decode
+    leaves total at its default.
+    """
+
+    def __init__(self, items_key: str = "records", total_key: str = "total_amount", default_total: Any = 0):
+        self.items_count = 0
+        self.total = default_total
+        self._items_key = items_key.encode()
+        self._total_key = total_key.encode()
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string = bytearray()   # Current depth-1 string (object key candidate)
+        self._last_string = b""
+        self._awaiting_items = False
+        self._in_items = False
+        self._items_seen = False
+        self._items_commas = 0
+        self._total_raw = None       # Raw bytes of the total value while it streams
+
+    def feed(self, chunk: bytes) -> None:
+        """Consume the next chunk of the document"""
+        pos, end = 0, len(chunk)
+        total_from = 0
+        while pos < end:
+            if self._in_string:
+                if self._escape:
+                    # Escaped byte left over from the previous chunk
+                    self._escape = False
+                    pos += 1
+                    continue
+                match = _JSON_STRING_SPECIAL.search(chunk, pos)
+                stop = match.start() if match else end
+                if self._depth == 1 and len(self._string) <= _MAX_KEY_BYTES:
+                    self._string += chunk[pos:stop]
+                if not match:
+                    break
+                pos = stop + 1
+                if chunk[stop] == 0x5C:  # backslash
+                    if pos < end:
+                        pos += 1
+                    else:
+                        self._escape = True
+                else:
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_string = bytes(self._string)
+                continue
+
+            match = _JSON_STRUCTURAL.search(chunk, pos)
+            stop = match.start() if match else end
+            # Scalars (numbers, true/false/null) have no structural byte of their own
+            if self._in_items and not self._items_seen and chunk[pos:stop].strip():
+                self._items_seen = True
+            if not match:
+                break
+            pos = stop + 1
+            byte = chunk[stop]
+
+            if byte == 0x22:  # "
+                self._in_string = True
+                self._string.clear()
+                if self._in_items and self._depth == 2:
+                    self._items_seen = True
+            elif byte in b"{[":
+                if self._in_items and self._depth == 2:
+                    self._items_seen = True
+                self._depth += 1
+                if self._awaiting_items and byte == 0x5B and self._depth == 2:
+                    self._in_items = True
+                    self._items_seen = False
+                    self._items_commas = 0
+                self._awaiting_items = False
+            elif byte in b"}]":
+                if self._in_items and self._depth == 2:
+                    self._in_items = False
+                    self.items_count = self._items_commas + 1 if self._items_seen else 0
+                self._depth -= 1
+                if self._depth == 0 and self._total_raw is not None:
+                    self._finish_total(chunk[total_from:stop])
+            elif byte == 0x2C:  # ,
+                if self._in_items and self._depth == 2:
+                    self._items_commas += 1
+                elif self._depth == 1:
+                    self._awaiting_items = False
+                    if self._total_raw is not None:
+                        self._finish_total(chunk[total_from:stop])
+            elif self._depth == 1:  # ":" after a top-level key
+                self._awaiting_items = self._last_string == self._items_key
+                if self._last_string == self._total_key:
+                    self._total_raw = bytearray()
+                    total_from = pos
+
+        if self._total_raw is not None:
+            self._total_raw += chunk[total_from:]
+
+    def _finish_total(self, tail: bytes) -> None:
+        self._total_raw += tail
+        try:
+            self.total = orjson.loads(bytes(self._total_raw))
+        except orjson.JSONDecodeError:
+            pass
+        self._total_raw = None
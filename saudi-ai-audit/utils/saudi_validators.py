@@ -3,10 +3,35 @@ Saudi Arabia specific validators for government compliance
 National ID, Iqama, Commercial Registration, IBAN validation
 """
 
+import functools
 import re
+import string
 from typing import Dict, Any, Optional, List
 from datetime import datetime, date
 
+# Input formats, compiled once at import rather than looked up per call.
+# \d keeps its Unicode meaning so Arabic-Indic digits are still accepted.
+_WHITESPACE_RE = re.compile(r'\s+')
+_PHONE_SEPARATORS_RE = re.compile(r'[\s\-\(\)]')
+_NATIONAL_ID_RE = re.compile(r'^[12]\d{9}$')
+_TEN_DIGITS_RE = re.compile(r'^\d{10}$')
+_SA_IBAN_RE = re.compile(r'^SA\d{20}$')
+_PHONE_RE = re.compile(r'^0\d{9}$')
+_POSTAL_CODE_RE = re.compile(r'^\d{5}$')
+_HIJRI_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_TAX_NUMBER_RE = re.compile(r'^\d{15}$')
+_MINISTRY_CODE_RE = re.compile(r'^MIN\d{3}$')
+_AGENCY_CODE_RE = re.compile(r'^AGY\d{3}$')
+_UNIVERSITY_CODE_RE = re.compile(r'^UNI\d{3}$')
+
+# Luhn contribution of a doubled digit (2d, minus 9 when it overflows one digit)
+_LUHN_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+# IBAN letters -> MOD-97 digits (A=10, B=11, ..., Z=35)
+_IBAN_LETTER_DIGITS = str.maketrans({
+    letter: str(i + 10) for i, letter in enumerate(string.ascii_uppercase)
+})
+
 class SaudiValidators:
     """
     أدوات التحقق السعودية
@@ -23,23 +48,14 @@ class SaudiValidators:
             return False
             
         # Clean the input
-        clean_id = re.sub(r'\s+', '', id_number)
+        clean_id = _WHITESPACE_RE.sub('', id_number)
         
         # Check basic format: starts with 1 or 2, followed by 9 more digits
-        if not re.match(r'^[12]\d{9}$', clean_id):
+        if not _NATIONAL_ID_RE.match(clean_id):
             return False
             
         # Checksum algorithm
-        total = 0
-        for i, digit in enumerate(clean_id[:-1]):
-            if i % 2 == 0:
-                doubled = int(digit) * 2
-                total += doubled if doubled < 10 else doubled - 9
-            else:
-                total += int(digit)
-                
-        checksum = (10 - (total % 10)) % 10
-        return checksum == int(clean_id[-1])
+        return SaudiValidators._validate_saudi_id_checksum(clean_id)
 
     @staticmethod
     def validate_iqama_number(iqama: str) -> bool:
@@ -60,9 +76,9 @@ class SaudiValidators:
             return False
         
         # Remove spaces and ensure it's exactly 10 digits
-        clean_iqama = re.sub(r'\s+', '', iqama)
+        clean_iqama = _WHITESPACE_RE.sub('', iqama)
         
-        if not re.match(r'^\d{10}$', clean_iqama):
+        if not _TEN_DIGITS_RE.match(clean_iqama):
             return False
         
         # First digit should be 3, 4, 5, 6, 7, 8, or 9 for residents
@@ -91,9 +107,9 @@ class SaudiValidators:
             return False
         
         # Remove spaces and ensure it's exactly 10 digits
-        clean_cr = re.sub(r'\s+', '', cr_number)
+        clean_cr = _WHITESPACE_RE.sub('', cr_number)
         
-        if not re.match(r'^\d{10}$', clean_cr):
+        if not _TEN_DIGITS_RE.match(clean_cr):
             return False
         
         # First digit typically indicates the region
@@ -124,10 +140,10 @@ class SaudiValidators:
             return False
         
         # Remove spaces and convert to uppercase
-        clean_iban = re.sub(r'\s+', '', iban.upper())
+        clean_iban = _WHITESPACE_RE.sub('', iban.upper())
         
         # Saudi IBAN format: SA followed by 2 check digits and 18 digits
-        if not re.match(r'^SA\d{20}$', clean_iban):
+        if not _SA_IBAN_RE.match(clean_iban):
             return False
         
         # IBAN checksum validation (MOD-97)
@@ -163,7 +179,7 @@ class SaudiValidators:
             return result
         
         # Clean phone number
-        clean_phone = re.sub(r'[\s\-\(\)]', '', phone)
+        clean_phone = _PHONE_SEPARATORS_RE.sub('', phone)
         
         # Remove country code if present
         if clean_phone.startswith('+966'):
@@ -178,7 +194,7 @@ class SaudiValidators:
             clean_phone = '0' + clean_phone
         
         # Validate format
-        if not re.match(r'^0\d{9}$', clean_phone):
+        if not _PHONE_RE.match(clean_phone):
             result["errors"].append("صيغة رقم الهاتف غير صحيحة")
             return result
         
@@ -232,10 +248,10 @@ class SaudiValidators:
             return result
         
         # Clean postal code
-        clean_code = re.sub(r'\s+', '', postal_code)
+        clean_code = _WHITESPACE_RE.sub('', postal_code)
         
         # Saudi postal codes are 5 digits
-        if not re.match(r'^\d{5}$', clean_code):
+        if not _POSTAL_CODE_RE.match(clean_code):
             result["errors"].append("الرمز البريدي يجب أن يكون 5 أرقام")
             return result
         
@@ -284,7 +300,7 @@ class SaudiValidators:
             return result
         
         # Check format
-        if not re.match(r'^\d{4}-\d{2}-\d{2}$', hijri_date):
+        if not _HIJRI_DATE_RE.match(hijri_date):
             result["errors"].append("صيغة التاريخ يجب أن تكون YYYY-MM-DD")
             return result
         
@@ -350,10 +366,10 @@ class SaudiValidators:
             return result
         
         # Clean tax number
-        clean_tax = re.sub(r'\s+', '', tax_number)
+        clean_tax = _WHITESPACE_RE.sub('', tax_number)
         
         # Saudi VAT numbers are 15 digits
-        if not re.match(r'^\d{15}$', clean_tax):
+        if not _TAX_NUMBER_RE.match(clean_tax):
             result["errors"].append("الرقم الضريبي يجب أن يكون 15 رقماً")
             return result
         
@@ -400,12 +416,12 @@ class SaudiValidators:
         clean_code = entity_code.strip().upper()
         
         # Government entity codes follow specific patterns
-        if re.match(r'^MIN\d{3}$', clean_code):  # Ministry
+        if _MINISTRY_CODE_RE.match(clean_code):  # Ministry
             result["entity_type"] = "ministry"
             result["ministry"] = SaudiValidators._get_ministry_from_code(clean_code)
-        elif re.match(r'^AGY\d{3}$', clean_code):  # Agency
+        elif _AGENCY_CODE_RE.match(clean_code):  # Agency
             result["entity_type"] = "agency"
-        elif re.match(r'^UNI\d{3}$', clean_code):  # University
+        elif _UNIVERSITY_CODE_RE.match(clean_code):  # University
             result["entity_type"] = "university"
         else:
             result["errors"].append("رمز الجهة الحكومية غير صحيح")
@@ -470,6 +486,7 @@ class SaudiValidators:
 
     # Private helper methods
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _validate_saudi_id_checksum(id_number: str) -> bool:
     
         """التحقق من الرقم التحققي للهوية السعودية"""
@@ -478,16 +495,15 @@ class SaudiValidators:
         
         # Simplified checksum validation
         # In real implementation, this would use the official algorithm
-        total = 0
-        for i, digit in enumerate(id_number[:-1]):
-            weight = 2 if i % 2 == 0 else 1
-            product = int(digit) * weight
-            total += product if product < 10 else product - 9
+        # Even positions are doubled (table lookup), odd positions added as-is
+        digits = list(map(int, id_number))
+        total = sum(_LUHN_DOUBLED[d] for d in digits[0:9:2]) + sum(digits[1:9:2])
         
         check_digit = (10 - (total % 10)) % 10
-        return check_digit == int(id_number[-1])
+        return check_digit == digits[9]
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _validate_iban_checksum(iban: str) -> bool:
     
         """التحقق من الآيبان باستخدام MOD-97"""
@@ -495,12 +511,7 @@ class SaudiValidators:
         rearranged = iban[4:] + iban[:4]
         
         # Replace letters with numbers (A=10, B=11, etc.)
-        numeric = ""
-        for char in rearranged:
-            if char.isalpha():
-                numeric += str(ord(char) - ord('A') + 10)
-            else:
-                numeric += char
+        numeric = rearranged.translate(_IBAN_LETTER_DIGITS)
         
         # Calculate MOD-97
         try: